@@ -6,6 +6,16 @@ Root conftest.py file for the entire project.
 pytest_plugins = ["pytest_asyncio"]
 
 
+def pytest_addoption(parser):
+    """Register command line options."""
+    parser.addoption(
+        "--cached",
+        action="store_true",
+        default=False,
+        help="Reuse generated test fixture files from .pytest_cache across runs",
+    )
+
+
 def pytest_configure(config):
     """Configure pytest options."""
     # Configure asyncio mode
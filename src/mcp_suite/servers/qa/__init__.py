@@ -12,20 +12,42 @@ Components:
 - autoflake: Detect and fix unused imports and variables
 
 Logging is configured to write to a file in the logs directory.
-The log file is overwritten each time a tool runs.
+The log file is overwritten each time a tool runs. Child processes, which
+import this package again, append to it instead.
 """
 
+import os
 import sys
-from pathlib import Path
 
 from loguru import logger
 
 # Get the path to the logs directory
-LOGS_DIR = Path(__file__).parent / "logs"
-LOG_FILE = LOGS_DIR / "saagalint.log"
+LOGS_DIR = os.path.join(os.path.dirname(__file__), "logs")
+LOG_FILE = os.path.join(LOGS_DIR, "saagalint.log")
 
-# Create logs directory if it doesn't exist
-LOGS_DIR.mkdir(exist_ok=True)
+# Set by the first process to open the log file. Child processes inherit it,
+# including the forkserver and worker processes that re-import this package,
+# and append to the log instead of truncating it
+_LOG_OWNER_ENV = "SAAGALINT_LOG_OWNER"
+
+# Log record templates for the console and file handlers
+_CONSOLE_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
+_FILE_FORMAT = (
+    "{time:YYYY-MM-DD HH:mm:ss} | "
+    "{level: <8} | "
+    "{name}:{function}:{line} - "
+    "{message}"
+)
+
+# Create logs directory if it doesn't exist; the directory is almost always
+# present, so a single stat avoids the mkdir syscall and FileExistsError path
+if not os.path.isdir(LOGS_DIR):
+    os.makedirs(LOGS_DIR, exist_ok=True)
 
 # Remove all existing handlers
 logger.remove()
@@ -34,28 +56,21 @@ logger.remove()
 logger.add(
     sys.stdout,
     colorize=True,
-    format=(
-        "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-        "<level>{level: <8}</level> | "
-        "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-        "<level>{message}</level>"
-    ),
+    format=_CONSOLE_FORMAT,
     level="INFO",
 )
 
-# Configure logger to write to file, overwriting existing file
+# Configure logger to write to file, overwriting existing file unless a
+# parent process is already writing to it
+_log_mode = "a" if _LOG_OWNER_ENV in os.environ else "w"
+os.environ.setdefault(_LOG_OWNER_ENV, str(os.getpid()))
 logger.add(
     LOG_FILE,
     rotation=None,  # No rotation
     retention=1,  # Keep only the latest file
-    format=(
-        "{time:YYYY-MM-DD HH:mm:ss} | "
-        "{level: <8} | "
-        "{name}:{function}:{line} - "
-        "{message}"
-    ),
+    format=_FILE_FORMAT,
     level="DEBUG",
-    mode="w",  # Overwrite the file each time
+    mode=_log_mode,
 )
 
 logger.info(f"Logging initialized. Log file: {LOG_FILE}")
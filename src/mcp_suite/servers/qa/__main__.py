@@ -7,7 +7,10 @@ and performing static analysis on Python code.
 
 This module serves as the entry point for the SaagaLint MCP server.
 It creates an MCP server instance, registers all tools, and provides
-a command-line interface using Google Fire.
+a command-line interface using Google Fire. The server is exposed as the
+module-level ``mcp`` attribute, which is what ``mcp dev`` and
+get_reinitalized_mcp look up. It is built, and the tools are registered,
+on first access, so importing this module stays cheap.
 
 Usage:
     # Run with default settings (stdio transport)
@@ -24,6 +27,8 @@ Usage:
 """
 
 import datetime
+import functools
+from typing import Any
 
 import fire
 from mcp.server.fastmcp import FastMCP
@@ -36,13 +41,39 @@ from mcp_suite.servers.qa.tools.register_tools import register_tools
 SERVER_START_TIME = datetime.datetime.now().isoformat()
 logger.info(f"Server starting at {SERVER_START_TIME}")
 
-# Create the MCP server instance
-mcp = FastMCP("precommit", settings={"host": "localhost", "port": 8081, "reload": True})
-logger.info("MCP server instance created")
 
-# Register all tools
-register_tools(mcp)
-logger.info("All tools registered")
+@functools.cache
+def _build_server() -> FastMCP:
+    """
+    Create the MCP server instance and register all tools.
+
+    The server is built once; later calls return the same instance.
+
+    Returns:
+        FastMCP: The configured MCP server instance
+    """
+    # Create the MCP server instance
+    server = FastMCP(
+        "precommit", settings={"host": "localhost", "port": 8081, "reload": True}
+    )
+    logger.info("MCP server instance created")
+
+    # Register all tools
+    register_tools(server)
+    logger.info("All tools registered")
+
+    return server
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Build the module-level ``mcp`` server on first access.
+
+    The MCP CLI and get_reinitalized_mcp look the server up as ``mcp``.
+    """
+    if name == "mcp":
+        return _build_server()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def run_server(transport="stdio", host="localhost", port=8081, debug=False):
@@ -63,6 +94,8 @@ def run_server(transport="stdio", host="localhost", port=8081, debug=False):
     Returns:
         None
     """
+    mcp = _build_server()
+
     # Update settings based on parameters
     mcp.settings.host = host
     mcp.settings.port = port
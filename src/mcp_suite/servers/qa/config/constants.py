@@ -4,13 +4,27 @@ Constants for the development server.
 
 from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
+from typing import Final, Mapping
 
 
 class ReportPaths(str, Enum):
     """Enum for report file paths."""
 
-    PYTEST_RESULTS = Path("./reports/pytest_results.json")
-    FAILED_TESTS = Path("./reports/failed_tests.json")
-    COVERAGE = Path("./reports/coverage.json")
-    AUTOFLAKE = Path("./reports/autoflake.json")
-    FLAKE8 = Path("./reports/flake8.json")
+    PYTEST_RESULTS = "reports/pytest_results.json"
+    FAILED_TESTS = "reports/failed_tests.json"
+    COVERAGE = "reports/coverage.json"
+    AUTOFLAKE = "reports/autoflake.json"
+    FLAKE8 = "reports/flake8.json"
+    LINT_CACHE = "reports/.lint-cache.json"
+
+    @property
+    def path(self) -> Path:
+        """Return the report path as a Path, shared across all callers."""
+        return _REPORT_PATHS[self]
+
+
+# Built once so every ReportPaths.X.path lookup returns the same Path instance
+_REPORT_PATHS: Final[Mapping[ReportPaths, Path]] = MappingProxyType(
+    {report: Path(report.value) for report in ReportPaths}
+)
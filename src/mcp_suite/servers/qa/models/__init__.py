@@ -1,10 +1,27 @@
-from .coverage_models import BranchCoverage, CoverageIssue
-from .pytest_models import (
-    PytestCollectionFailure,
-    PytestFailedTest,
-    PytestResults,
-    PytestSummary,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .coverage_models import BranchCoverage, CoverageIssue
+    from .pytest_models import (
+        PYTEST_RESULTS_ADAPTER,
+        PytestCollectionFailure,
+        PytestFailedTest,
+        PytestResults,
+        PytestSummary,
+    )
+
+# Models are imported on first access so that using one service does not pay
+# for building the pydantic validators of every other one
+_LAZY_IMPORTS = {
+    "BranchCoverage": ".coverage_models",
+    "CoverageIssue": ".coverage_models",
+    "PytestResults": ".pytest_models",
+    "PytestSummary": ".pytest_models",
+    "PytestCollectionFailure": ".pytest_models",
+    "PytestFailedTest": ".pytest_models",
+    "PYTEST_RESULTS_ADAPTER": ".pytest_models",
+}
 
 __all__ = [
     "BranchCoverage",
@@ -13,4 +30,18 @@ __all__ = [
     "PytestSummary",
     "PytestCollectionFailure",
     "PytestFailedTest",
+    "PYTEST_RESULTS_ADAPTER",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_LAZY_IMPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
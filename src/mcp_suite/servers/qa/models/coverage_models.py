@@ -1,6 +1,6 @@
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Union
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
 
 class BranchCoverage(BaseModel):
@@ -19,11 +19,26 @@ class BranchCoverage(BaseModel):
             raise ValueError("Branch list must have exactly 2 elements")
         return cls(source=branch_list[0], target=branch_list[1])
 
+    @classmethod
+    def from_lists(
+        cls, branch_lists: Sequence[List[Union[int, str]]]
+    ) -> List["BranchCoverage"]:
+        """Create BranchCoverage objects from [source, target] lists in one batch."""
+        if any(len(branch_list) != 2 for branch_list in branch_lists):
+            raise ValueError("Branch list must have exactly 2 elements")
+        return _BRANCH_LIST_ADAPTER.validate_python(
+            [{"source": source, "target": target} for source, target in branch_lists]
+        )
+
     def to_list(self) -> List[Union[int, str]]:
         """Convert to list format [source, target]."""
         return [self.source, self.target]
 
 
+# Validates a whole list of branches in a single call into pydantic-core
+_BRANCH_LIST_ADAPTER = TypeAdapter(List[BranchCoverage])
+
+
 class CoverageIssue(BaseModel):
     model_config = ConfigDict(frozen=False)
 
@@ -61,10 +76,15 @@ class CoverageIssue(BaseModel):
         # Convert branch lists to BranchCoverage objects
         missing_branches = None
         if "missing_branches" in data and data["missing_branches"]:
-            missing_branches = [
-                BranchCoverage.from_list(branch) if isinstance(branch, list) else branch
-                for branch in data["missing_branches"]
-            ]
+            branches = data["missing_branches"]
+            branch_lists = [branch for branch in branches if type(branch) is list]
+            if len(branch_lists) == len(branches):
+                missing_branches = BranchCoverage.from_lists(branch_lists)
+            else:
+                missing_branches = [
+                    BranchCoverage.from_list(branch) if type(branch) is list else branch
+                    for branch in branches
+                ]
 
         return cls(
             file_path=file_path,
@@ -1,14 +1,15 @@
 """Models for pytest results."""
 
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class PytestSummary(BaseModel):
     """Summary of pytest results."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     total: int = 0
     failed: int = 0
@@ -24,7 +25,7 @@ class PytestSummary(BaseModel):
 class PytestCollectionFailure(BaseModel):
     """Model for a pytest collection failure."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     nodeid: str
     outcome: str = "failed"
@@ -34,20 +35,39 @@ class PytestCollectionFailure(BaseModel):
 class PytestFailedTest(BaseModel):
     """Model for a failed pytest test."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     nodeid: str
     outcome: str = "failed"
     longrepr: Optional[str] = None
     duration: Optional[float] = None
+    lineno: int = 0
+    setup: Dict[str, Any] = Field(default_factory=dict)
+    call: Dict[str, Any] = Field(default_factory=dict)
+    teardown: Dict[str, Any] = Field(default_factory=dict)
 
 
 class PytestResults(BaseModel):
     """Model for pytest results."""
 
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
     summary: PytestSummary
     failed_collections: List[PytestCollectionFailure] = Field(default_factory=list)
     failed_tests: List[PytestFailedTest] = Field(default_factory=list)
     error: Optional[str] = None
+
+    @cached_property
+    def json_bytes(self) -> bytes:
+        """
+        The results serialized as indented JSON, as written to report files.
+
+        Instances are frozen, so the bytes are computed on first access and
+        reused for every later write of the same results.
+        """
+        return self.model_dump_json(indent=2).encode()
+
+
+# Built once at import so callers can validate raw JSON bytes directly with
+# PYTEST_RESULTS_ADAPTER.validate_json(...) instead of json.loads + validate
+PYTEST_RESULTS_ADAPTER = TypeAdapter(PytestResults)
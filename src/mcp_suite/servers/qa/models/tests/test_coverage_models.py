@@ -47,6 +47,21 @@ class TestBranchCoverage:
         ):
             BranchCoverage.from_list([1, 2, 3])
 
+    def test_from_lists(self):
+        """Test creating several branches from lists in one batch."""
+        branches = BranchCoverage.from_lists([[1, 2], ["a", "b"]])
+        assert [branch.to_list() for branch in branches] == [[1, 2], ["a", "b"]]
+        assert all(isinstance(branch, BranchCoverage) for branch in branches)
+
+        assert BranchCoverage.from_lists([]) == []
+
+    def test_from_lists_invalid(self):
+        """Test creating several branches when one list is invalid."""
+        with pytest.raises(
+            ValueError, match="Branch list must have exactly 2 elements"
+        ):
+            BranchCoverage.from_lists([[1, 2], [3]])
+
     def test_to_list(self):
         """Test converting to a list."""
         branch = BranchCoverage(source=1, target=2)
@@ -0,0 +1,57 @@
+"""Tests for pytest models."""
+
+import pytest
+from pydantic import ValidationError
+
+from mcp_suite.servers.qa.models.pytest_models import (
+    PytestFailedTest,
+    PytestResults,
+    PytestSummary,
+)
+
+
+class TestPytestFailedTest:
+    """Tests for the PytestFailedTest class."""
+
+    def test_phase_fields(self):
+        """Test that per-phase report data is kept as declared fields."""
+        test = PytestFailedTest(
+            nodeid="test_file.py::test_failing",
+            lineno=10,
+            call={"outcome": "failed"},
+        )
+        assert test.lineno == 10
+        assert test.setup == {}
+        assert test.call == {"outcome": "failed"}
+        assert test.teardown == {}
+
+    def test_extra_fields_ignored(self):
+        """Test that undeclared fields are dropped."""
+        test = PytestFailedTest(nodeid="test_file.py::test_failing", keywords={})
+        assert "keywords" not in test.model_dump()
+        assert test.model_extra is None
+
+    def test_frozen(self):
+        """Test that instances are immutable."""
+        summary = PytestSummary(total=1)
+        with pytest.raises(ValidationError):
+            summary.total = 2
+
+
+class TestPytestResults:
+    """Tests for the PytestResults class."""
+
+    def test_json_bytes(self):
+        """Test that the serialized results are computed once and reused."""
+        results = PytestResults(summary=PytestSummary(total=1, passed=1))
+
+        assert results.json_bytes == results.model_dump_json(indent=2).encode()
+        assert results.json_bytes is results.json_bytes
+
+    def test_json_bytes_not_a_field(self):
+        """Test that the cached bytes don't affect equality or dumps."""
+        results = PytestResults(summary=PytestSummary(total=1))
+        _ = results.json_bytes
+
+        assert results == PytestResults(summary=PytestSummary(total=1))
+        assert "json_bytes" not in results.model_dump()
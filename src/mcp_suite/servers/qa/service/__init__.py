@@ -4,10 +4,16 @@
 # Import the centralized logger
 from mcp_suite.servers.qa import logger
 
-from .coverage import process_coverage_json
-from .pytest import process_pytest_results
+from .coverage import process_coverage_dict, process_coverage_json
+from .pytest import process_pytest_results, process_pytest_results_many
 
 # Bind the component field to the logger
 logger = logger.bind(component="service")
 
-__all__ = ["process_coverage_json", "process_pytest_results", "logger"]
+__all__ = [
+    "process_coverage_dict",
+    "process_coverage_json",
+    "process_pytest_results",
+    "process_pytest_results_many",
+    "logger",
+]
@@ -1,13 +1,23 @@
 """Coverage service functions for the pytest server."""
 
 import json
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterator, List, Mapping, Tuple, Union
+
+import ijson
 
 from mcp_suite.servers.qa import logger
 from mcp_suite.servers.qa.models.coverage_models import (
     BranchCoverage,
     CoverageIssue,
 )
+from mcp_suite.servers.qa.utils.json_utils import (
+    consume_json_value,
+    get_file_size,
+    load_json_file,
+)
+
+# Reports at least this large are streamed with ijson instead of loaded whole
+STREAM_THRESHOLD = 16 << 20
 
 # Remove redundant import and setup since it's already done in __init__.py
 # from mcp_suite.servers.dev.config.config import setup_logging
@@ -33,16 +43,53 @@ def process_coverage_json(
         json.JSONDecodeError: If the coverage file contains invalid JSON
     """
     logger.info(f"Processing coverage data from {coverage_file}")
-    if specific_file:
-        logger.info(f"Filtering for specific file: {specific_file}")
 
     try:
         logger.debug(f"Opening coverage file: {coverage_file}")
-        with open(coverage_file, "r") as f:
-            data = json.load(f)
+        if get_file_size(coverage_file) >= STREAM_THRESHOLD:
+            logger.debug(f"Streaming large coverage file: {coverage_file}")
+            if specific_file:
+                logger.info(f"Filtering for specific file: {specific_file}")
+            return _process_file_entries(
+                _stream_file_entries(coverage_file, specific_file), specific_file
+            )
+
+        return process_coverage_dict(load_json_file(coverage_file), specific_file)
+
+    except FileNotFoundError:
+        logger.error(f"Coverage file not found: {coverage_file}")
+        raise
+    except json.JSONDecodeError as e:
+        logger.error(f"Invalid JSON in coverage file: {e}")
+        raise
+    except Exception as e:
+        logger.exception(f"Error processing coverage data: {e}")
+        return []
+
+
+def process_coverage_dict(
+    data: Mapping[str, Any], specific_file: str = ""
+) -> List[CoverageIssue]:
+    """
+    Process an already decoded coverage report.
+
+    This is process_coverage_json without the file handling, for callers that
+    hold the report in memory.
+
+    Args:
+        data: The coverage report, shaped like coverage.py's JSON output
+        specific_file: Optional file path to filter results for a specific file
+
+    Returns:
+        A list of CoverageIssue objects, or an empty list if the report is
+        malformed
+    """
+    if specific_file:
+        logger.info(f"Filtering for specific file: {specific_file}")
 
+    try:
         # Check if the data has the expected structure
-        if not isinstance(data, dict):
+        if not isinstance(data, Mapping):
             logger.warning("Coverage data is not a dictionary")
             return []
 
@@ -50,61 +97,100 @@ def process_coverage_json(
             logger.warning("Coverage data does not contain 'files' key")
             return []
 
+        # Pick the loop once rather than re-testing specific_file per entry
         coverage_data = data["files"]
-        result = []
-
-        # Filter for specific file if provided
         if specific_file:
-            # Find the closest match if exact match not found
-            matching_files = [
-                path for path in coverage_data.keys() if specific_file in path
-            ]
-
-            if not matching_files:
-                logger.warning(f"No matching files found for {specific_file}")
-                return []
-
-            logger.debug(
-                f"Found {len(matching_files)} matching files: {matching_files}"
+            entries = (
+                (path, file_data)
+                for path, file_data in coverage_data.items()
+                if specific_file in path
             )
-
-            # Process each matching file
-            for file_path in matching_files:
-                file_data = coverage_data[file_path]
-                try:
-                    process_file_data(file_path, file_data, result)
-                except Exception as e:
-                    logger.exception(f"Error processing file {file_path}: {e}")
-                    # If an exception occurs during processing, return an empty list
-                    return []
         else:
-            # Process all files with coverage issues
-            for file_path, file_data in coverage_data.items():
-                if not isinstance(file_data, dict):
-                    logger.warning(f"Skipping {file_path} - data is not a dictionary")
-                    continue
+            entries = iter(coverage_data.items())
 
-                try:
-                    process_file_data(file_path, file_data, result)
-                except Exception as e:
-                    logger.exception(f"Error processing file {file_path}: {e}")
-                    # If an exception occurs during processing, return an empty list
-                    return []
+        return _process_file_entries(entries, specific_file)
 
-        logger.info(f"Found {len(result)} coverage issues")
-        return result
-
-    except FileNotFoundError:
-        logger.error(f"Coverage file not found: {coverage_file}")
-        raise
-    except json.JSONDecodeError as e:
-        logger.error(f"Invalid JSON in coverage file: {e}")
-        raise
     except Exception as e:
         logger.exception(f"Error processing coverage data: {e}")
         return []
 
 
+def _process_file_entries(
+    entries: Iterator[Tuple[str, Any]], specific_file: str = ""
+) -> List[CoverageIssue]:
+    """
+    Collect the coverage issues of (file_path, file_data) pairs.
+
+    Args:
+        entries: File paths and their coverage data, already filtered
+        specific_file: The file filter the entries were selected with
+
+    Returns:
+        A list of CoverageIssue objects, or an empty list if any file fails
+    """
+    result = []
+    found_files = False
+
+    for file_path, file_data in entries:
+        found_files = True
+        if not isinstance(file_data, Mapping):
+            logger.warning(f"Skipping {file_path} - data is not a dictionary")
+            continue
+
+        try:
+            process_file_data(file_path, file_data, result)
+        except Exception as e:
+            logger.exception(f"Error processing file {file_path}: {e}")
+            # If an exception occurs during processing, return an empty list
+            return []
+
+    if specific_file and not found_files:
+        logger.warning(f"No matching files found for {specific_file}")
+        return []
+
+    logger.info(f"Found {len(result)} coverage issues")
+    return result
+
+
+def _stream_file_entries(
+    coverage_file: str, specific_file: str = ""
+) -> Iterator[Tuple[str, Any]]:
+    """
+    Stream (file_path, file_data) pairs from the "files" object of a report.
+
+    Only one file entry is materialized at a time, and entries whose path
+    does not contain specific_file are tokenized but never built.
+
+    Args:
+        coverage_file: Path to the coverage JSON file
+        specific_file: Optional file path to filter results for a specific file
+
+    Yields:
+        Tuples of file path and that file's coverage data
+
+    Raises:
+        FileNotFoundError: If the coverage file doesn't exist
+        json.JSONDecodeError: If the coverage file contains invalid JSON
+    """
+    with open(coverage_file, "rb") as f:
+        parser = ijson.parse(f, use_float=True)
+        try:
+            for prefix, event, value in parser:
+                if prefix != "files" or event != "map_key":
+                    continue
+
+                file_path = value
+                builder = None
+                if not specific_file or specific_file in file_path:
+                    builder = ijson.ObjectBuilder()
+
+                consume_json_value(parser, builder)
+                if builder is not None:
+                    yield file_path, builder.value
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+
 def process_file_data(
     file_path: str, file_data: Dict[str, Any], result: List[CoverageIssue]
 ) -> None:
@@ -128,110 +214,24 @@ def process_file_data(
     try:
         has_processed_issues = False
 
-        # Process sections if available
-        if "sections" in file_data and file_data["sections"] is not None:
-            section_issues = _process_section(file_path, file_data["sections"])
+        # Sections, functions and classes share the same per-entry layout, so
+        # each one is walked exactly once by _process_section
+        for key in ("sections", "functions", "classes"):
+            if not file_data.get(key):
+                continue
+
+            section_issues = _process_section(file_path, file_data[key])
             if section_issues:
                 result.extend(section_issues)
                 has_processed_issues = True
+            else:
+                logger.debug(f"No {key} issues found for {file_path}")
 
-        # Process functions if available
-        if "functions" in file_data and file_data["functions"]:
-            logger.debug(f"Processing functions for {file_path}")
-            has_function_issues = False
-            for func_name, func_data in file_data["functions"].items():
-                if not isinstance(func_data, dict):
-                    continue
-
-                # Process missing lines
-                if "missing_lines" in func_data and func_data["missing_lines"]:
-                    issue = CoverageIssue(
-                        file_path=file_path,
-                        section_name=func_name,
-                        missing_lines=func_data["missing_lines"],
-                        missing_branches=None,
-                    )
-                    result.append(issue)
-                    has_function_issues = True
-                    has_processed_issues = True
-                    logger.debug(f"Added issue for function {func_name} missing lines")
-
-                # Process missing branches
-                if "missing_branches" in func_data and func_data["missing_branches"]:
-                    branches = []
-                    for branch in func_data["missing_branches"]:
-                        if isinstance(branch, list) and len(branch) == 2:
-                            branches.append(
-                                BranchCoverage(source=branch[0], target=branch[1])
-                            )
-
-                    if branches:
-                        issue = CoverageIssue(
-                            file_path=file_path,
-                            section_name=func_name,
-                            missing_lines=None,
-                            missing_branches=branches,
-                        )
-                        result.append(issue)
-                        has_function_issues = True
-                        has_processed_issues = True
-                        logger.debug(
-                            f"Added issue for function {func_name} missing branches"
-                        )
-
-            if not has_function_issues:
-                logger.debug(f"No function issues found for {file_path}")
-
-        # Process classes if available
-        if "classes" in file_data and file_data["classes"]:
-            logger.debug(f"Processing classes for {file_path}")
-            has_class_issues = False
-            for class_name, class_data in file_data["classes"].items():
-                if not isinstance(class_data, dict):
-                    continue
-
-                # Process missing lines
-                if "missing_lines" in class_data and class_data["missing_lines"]:
-                    issue = CoverageIssue(
-                        file_path=file_path,
-                        section_name=class_name,
-                        missing_lines=class_data["missing_lines"],
-                        missing_branches=None,
-                    )
-                    result.append(issue)
-                    has_class_issues = True
-                    has_processed_issues = True
-                    logger.debug(f"Added issue for class {class_name} missing lines")
-
-                # Process missing branches
-                if "missing_branches" in class_data and class_data["missing_branches"]:
-                    branches = []
-                    for branch in class_data["missing_branches"]:
-                        if isinstance(branch, list) and len(branch) == 2:
-                            branches.append(
-                                BranchCoverage(source=branch[0], target=branch[1])
-                            )
-
-                    if branches:
-                        issue = CoverageIssue(
-                            file_path=file_path,
-                            section_name=class_name,
-                            missing_lines=None,
-                            missing_branches=branches,
-                        )
-                        result.append(issue)
-                        has_class_issues = True
-                        has_processed_issues = True
-                        logger.debug(
-                            f"Added issue for class {class_name} missing branches"
-                        )
-
-            if not has_class_issues:
-                logger.debug(f"No class issues found for {file_path}")
-
-        # If no issues were processed, create a basic issue for the file
+        # If no issues were processed, create a basic issue for the file. The
+        # values come straight from the decoded report, so issues are built
+        # without re-validating them
         if not has_processed_issues:
-            issue = CoverageIssue(
+            issue = CoverageIssue.model_construct(
                 file_path=file_path,
                 section_name="",  # Empty section name for file-level issues
                 missing_lines=file_data.get("missing_lines", []),
@@ -262,7 +262,12 @@ def _process_section(file_path: str, sections: Dict[str, Any]) -> List[CoverageI
     logger.debug(f"Processing sections for {file_path}")
     result = []
 
+    # Reports are decoded JSON, so an exact type check is enough here and
+    # skips the subclass walk isinstance() would do for every entry
     for section_name, section_data in sections.items():
+        if type(section_data) is not dict:
+            continue
+
         # Skip sections with 100% coverage
         if (
             "missing_lines" not in section_data or not section_data["missing_lines"]
@@ -275,7 +280,7 @@ def _process_section(file_path: str, sections: Dict[str, Any]) -> List[CoverageI
         # Create separate issues for missing lines and missing branches
         if "missing_lines" in section_data and section_data["missing_lines"]:
             # Create an issue for missing lines
-            issue = CoverageIssue(
+            issue = CoverageIssue.model_construct(
                 file_path=file_path,
                 section_name=section_name,
                 missing_lines=section_data.get("missing_lines", []),
@@ -287,14 +292,16 @@ def _process_section(file_path: str, sections: Dict[str, Any]) -> List[CoverageI
             )
 
         if "missing_branches" in section_data and section_data["missing_branches"]:
+            branches = _process_branches(section_data["missing_branches"])
+            if not branches:
+                continue
+
             # Create an issue for missing branches
-            issue = CoverageIssue(
+            issue = CoverageIssue.model_construct(
                 file_path=file_path,
                 section_name=section_name,
                 missing_lines=None,
-                missing_branches=_process_branches(
-                    section_data.get("missing_branches", [])
-                ),
+                missing_branches=branches,
             )
             result.append(issue)
             logger.debug(
@@ -328,13 +335,13 @@ def _process_branches(
             result.append(branch_cov)
     # Handle list format (from function/class level missing_branches)
     elif isinstance(branches_data, list):
-        for branch in branches_data:
-            if isinstance(branch, list) and len(branch) == 2:
-                branch_cov = BranchCoverage(
-                    source=branch[0],
-                    target=branch[1],
-                )
-                result.append(branch_cov)
+        result = BranchCoverage.from_lists(
+            [
+                branch
+                for branch in branches_data
+                if type(branch) is list and len(branch) == 2
+            ]
+        )
 
     return result
 
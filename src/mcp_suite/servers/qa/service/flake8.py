@@ -1,15 +1,20 @@
 """Autoflake service functions for the pytest server."""
 
 import json
+import os
+from itertools import chain
 from pathlib import Path
 from typing import Any, Dict, Union
 
+import orjson
+
 from mcp_suite.servers.qa import logger
 from mcp_suite.servers.qa.config import ReportPaths
+from mcp_suite.servers.qa.utils.json_utils import load_json_file
 
 
 def process_flake8_results(
-    input_file: Union[str, Path] = ReportPaths.AUTOFLAKE,
+    input_file: Union[str, Path] = ReportPaths.AUTOFLAKE.path,
 ) -> Dict[str, Any]:
     """
     Process autoflake results JSON and extract issues.
@@ -22,35 +27,25 @@ def process_flake8_results(
     """
     logger.info(f"Processing flake8 results from {input_file}")
 
-    # Convert string paths to Path objects if needed
-    input_path = Path(input_file) if isinstance(input_file, str) else input_file
+    # open() takes str and PathLike alike, so no Path object is built here
+    input_path = os.fspath(input_file)
     logger.debug(f"Input path: {input_path}")
 
     try:
-        # Check if the file exists
-        if not input_path.exists():
-            logger.warning(f"Flake8 results file not found: {input_path}")
-            return {
-                "Status": "Success",
-                "Message": "No issues found (results file not present).",
-                "Instructions": (
-                    "Your code appears to be clean with no unused imports or variables."
-                ),
-            }
-
-        # Load the JSON file
+        # Load the JSON file. A missing file is reported by open() itself, so
+        # there is no separate exists() check to race against
         logger.debug(f"Loading JSON from {input_path}")
-        with open(input_path, "r") as f:
-            results_data = json.load(f)
+        results_data = load_json_file(input_path)
 
-        # Flatten the results - extract all issues from files with non-empty arrays
-        all_issues = []
-        for _, issues in results_data.items():
-            if issues:  # Only process non-empty lists
-                all_issues.extend(issues)
+        # Only the first issue is reported, so stop at the first file that has one
+        # instead of flattening every file's issues into a single list
+        first_issue = next(
+            chain.from_iterable(issues for issues in results_data.values() if issues),
+            None,
+        )
 
         # If no issues found, return success
-        if not all_issues:
+        if first_issue is None:
             logger.info("No flake8 issues found")
             return {
                 "Status": "Success",
@@ -63,9 +58,11 @@ def process_flake8_results(
                 ),
             }
 
-        # Get the first issue to fix
-        first_issue = all_issues[0]
-        logger.info(f"Found flake8 issue: {json.dumps(first_issue, indent=2)}")
+        # Only serialize the issue if a sink actually accepts INFO records
+        logger.opt(lazy=True).info(
+            "Found flake8 issue: {}",
+            lambda: orjson.dumps(first_issue, option=orjson.OPT_INDENT_2).decode(),
+        )
 
         return {
             "Status": "Issues Found",
@@ -76,6 +73,16 @@ def process_flake8_results(
             ),
         }
 
+    except FileNotFoundError:
+        logger.warning(f"Flake8 results file not found: {input_path}")
+        return {
+            "Status": "Success",
+            "Message": "No issues found (results file not present).",
+            "Instructions": (
+                "Your code appears to be clean with no unused imports or variables."
+            ),
+        }
+
     except json.JSONDecodeError as e:
         error_msg = f"Error: Invalid JSON in {input_path}: {str(e)}"
         logger.error(error_msg)
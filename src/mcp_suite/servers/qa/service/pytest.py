@@ -1,8 +1,16 @@
 """Pytest service functions for the pytest server."""
 
+import hashlib
 import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from typing import Union
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import ijson
 
 from mcp_suite.servers.qa import logger
 from mcp_suite.servers.qa.config import ReportPaths
@@ -12,11 +20,43 @@ from mcp_suite.servers.qa.models.pytest_models import (
     PytestResults,
     PytestSummary,
 )
+from mcp_suite.servers.qa.utils.json_utils import (
+    consume_json_value,
+    get_file_size,
+    load_json_file,
+    write_file_atomic,
+)
+
+# Reports at least this large are streamed with ijson instead of loaded whole
+STREAM_THRESHOLD = 16 << 20
+
+# Digest and stat signature of each output file as this process last wrote it
+_OUTPUT_DIGESTS: Dict[str, Tuple[bytes, Tuple[int, ...]]] = {}
+
+# Summary counters copied from the report, read in one C-level itemgetter call
+_SUMMARY_KEYS = (
+    "total",
+    "failed",
+    "passed",
+    "skipped",
+    "errors",
+    "xfailed",
+    "xpassed",
+    "collected",
+)
+_SUMMARY_DEFAULTS = dict.fromkeys(_SUMMARY_KEYS, 0)
+_get_summary_counts = itemgetter(*_SUMMARY_KEYS)
+
+# Error message templates, filled in with str.format on the error paths
+_ERR_NO_TESTS = "Error: 'tests' key not found in {}"
+_ERR_NOT_FOUND = "Error: File not found: {}"
+_ERR_INVALID_JSON = "Error: Invalid JSON in {}: {}"
+_ERR_PROCESSING = "Error processing pytest results: {}"
 
 
 def process_pytest_results(
-    input_file: Union[str, Path] = ReportPaths.PYTEST_RESULTS.value,
-    output_file: Union[str, Path] = ReportPaths.FAILED_TESTS.value,
+    input_file: Union[str, Path] = ReportPaths.PYTEST_RESULTS.path,
+    output_file: Union[str, Path] = ReportPaths.FAILED_TESTS.path,
 ) -> PytestResults:
     """
     Process pytest results JSON and extract failed collections and failed tests.
@@ -35,84 +75,60 @@ def process_pytest_results(
     """
     logger.info(f"Processing pytest results from {input_file}")
 
-    # Convert string paths to Path objects if needed
-    input_path = Path(input_file) if isinstance(input_file, str) else input_file
-    output_path = Path(output_file) if isinstance(output_file, str) else output_file
-    logger.debug(f"Input path: {input_path}, Output path: {output_path}")
+    # open() takes str and PathLike alike, so no Path objects are built here
+    input_path = os.fspath(input_file)
+    output_path = os.fspath(output_file)
+    logger.debug("Input path: {}, Output path: {}", input_path, output_path)
 
     try:
         # Load the JSON file
-        logger.debug(f"Loading JSON from {input_path}")
-        with open(input_path, "r") as f:
-            results_data = json.load(f)
+        logger.debug("Loading JSON from {}", input_path)
+        if get_file_size(input_path) >= STREAM_THRESHOLD:
+            results_data = _stream_results_data(input_path)
+        else:
+            results_data = load_json_file(input_path)
 
         # Ensure tests key exists
         if "tests" not in results_data:
-            error_msg = f"Error: 'tests' key not found in {input_path}"
-            logger.error(error_msg)
-            return PytestResults(summary=PytestSummary(), error=error_msg)
+            return _error_result(_ERR_NO_TESTS.format(input_path))
+
+        summary_raw = results_data.get("summary") or {}
+
+        # Bound once so the comprehensions below skip the attribute lookup
+        build_collection_failure = PytestCollectionFailure.model_construct
 
         # Extract failed collections
         failed_collections = []
         if "collectors" in results_data:
             logger.debug("Processing collection errors")
-            # Handle both formats: list of collectors or dict with errors key
-            if isinstance(results_data["collectors"], list):
-                for collector in results_data["collectors"]:
-                    if collector.get("outcome") == "failed":
-                        failed_collections.append(
-                            PytestCollectionFailure(
-                                nodeid=collector.get("nodeid", "Unknown"),
-                                outcome=collector.get("outcome", "failed"),
-                                longrepr=collector.get("longrepr", "Unknown error"),
-                            )
-                        )
-            elif (
-                isinstance(results_data["collectors"], dict)
-                and "errors" in results_data["collectors"]
-            ):
-                for error in results_data["collectors"]["errors"]:
-                    failed_collections.append(
-                        PytestCollectionFailure(
-                            nodeid=error.get("nodeid", "Unknown"),
-                            outcome="failed",
-                            longrepr=error.get("longrepr", "Unknown error"),
-                        )
-                    )
+            failed_collections = [
+                build_collection_failure(
+                    nodeid=collector.get("nodeid", "Unknown"),
+                    outcome="failed",
+                    longrepr=collector.get("longrepr", "Unknown error"),
+                )
+                for collector in _normalize_collectors(results_data["collectors"])
+            ]
             if failed_collections:
                 logger.warning(f"Found {len(failed_collections)} collection errors")
 
-        # Extract failed tests
+        # Extract failed tests. A summary reporting no failures means there is
+        # nothing to find, so the (possibly very long) tests list is skipped
         failed_tests = []
-        if "tests" in results_data:
+        if not summary_raw or summary_raw.get("failed", 0):
             logger.debug("Processing test failures")
-            for test in results_data["tests"]:
-                if test.get("outcome") == "failed":
-                    failed_tests.append(
-                        PytestFailedTest(
-                            nodeid=test.get("nodeid", "Unknown"),
-                            outcome=test.get("outcome", "Unknown"),
-                            longrepr=test.get("longrepr", None),
-                            duration=test.get("duration", None),
-                            lineno=test.get("lineno", 0),
-                            setup=test.get("setup", {}),
-                            call=test.get("call", {}),
-                            teardown=test.get("teardown", {}),
-                        )
-                    )
+            failed_tests = [
+                _build_failed_test(test)
+                for test in results_data["tests"]
+                if test.get("outcome") == "failed"
+            ]
             if failed_tests:
                 logger.warning(f"Found {len(failed_tests)} test failures")
 
         # Extract summary
-        summary = PytestSummary(
-            total=results_data.get("summary", {}).get("total", 0),
-            failed=results_data.get("summary", {}).get("failed", 0),
-            passed=results_data.get("summary", {}).get("passed", 0),
-            skipped=results_data.get("summary", {}).get("skipped", 0),
-            errors=results_data.get("summary", {}).get("errors", 0),
-            xfailed=results_data.get("summary", {}).get("xfailed", 0),
-            xpassed=results_data.get("summary", {}).get("xpassed", 0),
-            collected=results_data.get("summary", {}).get("collected", 0),
+        summary_counts = _get_summary_counts(_SUMMARY_DEFAULTS | summary_raw)
+        summary = PytestSummary.model_construct(
+            **dict(zip(_SUMMARY_KEYS, summary_counts)),
             collection_failures=len(failed_collections),
         )
         logger.info(f"Test summary: {summary.model_dump()}")
@@ -125,26 +141,226 @@ def process_pytest_results(
         )
 
         # Write the results to the output file
-        logger.debug(f"Writing results to {output_path}")
-        with open(output_path, "w") as f:
-            json.dump(results.model_dump(), f, indent=2)
+        logger.debug("Writing results to {}", output_path)
+        _write_results(output_path, results.json_bytes)
 
         return results
 
     except FileNotFoundError:
-        error_msg = f"Error: File not found: {input_path}"
-        logger.error(error_msg)
-        return PytestResults(summary=PytestSummary(), error=error_msg)
+        return _error_result(_ERR_NOT_FOUND.format(input_path))
 
     except json.JSONDecodeError as e:
-        error_msg = f"Error: Invalid JSON in {input_path}: {str(e)}"
-        logger.error(error_msg)
-        return PytestResults(summary=PytestSummary(), error=error_msg)
+        return _error_result(_ERR_INVALID_JSON.format(input_path, e))
 
     except Exception as e:
-        error_msg = f"Error processing pytest results: {str(e)}"
-        logger.exception(error_msg)
-        return PytestResults(summary=PytestSummary(), error=error_msg)
+        return _error_result(_ERR_PROCESSING.format(e), exception=True)
+
+
+def process_pytest_results_many(
+    paths: Iterable[Tuple[Union[str, Path], Union[str, Path]]],
+    max_workers: Optional[int] = None,
+) -> List[PytestResults]:
+    """
+    Process several pytest results files in parallel.
+
+    Parsing and model construction are CPU-bound, so each (input_file,
+    output_file) pair is handed to process_pytest_results in a separate
+    worker process started by a forkserver. A single pair is processed in the
+    calling process.
+
+    Args:
+        paths: Pairs of input results file and output file
+        max_workers: Maximum number of worker processes (default: CPU count)
+
+    Returns:
+        A PytestResults object per pair, in the same order as paths
+    """
+    pairs = list(paths)
+    if len(pairs) <= 1:
+        return [process_pytest_results(*pair) for pair in pairs]
+
+    input_files, output_files = zip(*pairs)
+    # forkserver rather than the default fork: this runs inside the threaded
+    # MCP server, where forking can deadlock the child on a held lock
+    with ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("forkserver")
+    ) as executor:
+        return list(
+            executor.map(process_pytest_results, input_files, output_files, chunksize=4)
+        )
+
+
+def _error_result(error_msg: str, exception: bool = False) -> PytestResults:
+    """
+    Log an error and return it as an otherwise empty PytestResults.
+
+    Args:
+        error_msg: The error message to log and return
+        exception: Whether to log the traceback of the exception being handled
+
+    Returns:
+        A PytestResults with an empty summary and error set to error_msg
+    """
+    logger.opt(exception=exception).error(error_msg)
+    return PytestResults(summary=PytestSummary(), error=error_msg)
+
+
+def _write_results(output_path: str, payload: bytes) -> None:
+    """
+    Write serialized results unless the output file already holds them.
+
+    The write is skipped when the payload's digest matches the one recorded
+    for the last write to output_path and the file's stat signature shows it
+    has not been touched since.
+
+    Args:
+        output_path: Path of the output file
+        payload: Serialized results to write
+    """
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    previous = _OUTPUT_DIGESTS.get(output_path)
+    if previous is not None and previous[0] == digest:
+        if _stat_signature(output_path) == previous[1]:
+            logger.debug("Results unchanged, not rewriting {}", output_path)
+            return
+
+    write_file_atomic(output_path, payload)
+    signature = _stat_signature(output_path)
+    if signature is None:
+        _OUTPUT_DIGESTS.pop(output_path, None)
+    else:
+        _OUTPUT_DIGESTS[output_path] = (digest, signature)
+
+
+def _stat_signature(path: str) -> Optional[Tuple[int, ...]]:
+    """
+    Return (inode, mtime_ns, ctime_ns, size) for path, or None if it can't be
+    stat'ed.
+
+    The inode catches files replaced by rename, as atomic writers do, even
+    when the timestamps are too coarse to tell two writes apart.
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+
+def _normalize_collectors(collectors: Any) -> List[Dict[str, Any]]:
+    """
+    Return the failed collector entries of a report's "collectors" value.
+
+    Both shapes are accepted: a list of collectors, of which only those with
+    a "failed" outcome are kept, or a dict whose "errors" list holds only
+    failures. Any other value has no failures.
+
+    Args:
+        collectors: The "collectors" value of a pytest results file
+
+    Returns:
+        The failed collector entries
+    """
+    if isinstance(collectors, list):
+        return [
+            collector
+            for collector in collectors
+            if collector.get("outcome") == "failed"
+        ]
+    if isinstance(collectors, dict):
+        return collectors.get("errors", [])
+    return []
+
+
+def _build_failed_test(test: Dict[str, Any]) -> PytestFailedTest:
+    """
+    Build a PytestFailedTest from a pytest-json-report test entry.
+
+    The setup, call and teardown phases are fetched together through one bound
+    test.get, rather than each phase resolving it separately.
+
+    Args:
+        test: A failed entry from the report's "tests" list
+
+    Returns:
+        The failed test, constructed without validation
+    """
+    get = test.get
+    return PytestFailedTest.model_construct(
+        nodeid=get("nodeid", "Unknown"),
+        outcome=test["outcome"],
+        longrepr=get("longrepr"),
+        duration=get("duration"),
+        lineno=get("lineno", 0),
+        setup=get("setup", {}),
+        call=get("call", {}),
+        teardown=get("teardown", {}),
+    )
+
+
+def _stream_results_data(input_path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Stream the parts of a pytest results file that process_pytest_results uses.
+
+    The file is parsed in a single pass. Only the "summary" and "collectors"
+    values and the failed entries of "tests" are built; passing tests are
+    built one at a time and dropped, and every other key is skipped.
+
+    Args:
+        input_path: Path to the pytest results JSON file
+
+    Returns:
+        A dictionary shaped like the results file, with "tests" pruned to
+        failed tests
+
+    Raises:
+        FileNotFoundError: If the input file doesn't exist
+        json.JSONDecodeError: If the input file isn't valid JSON
+    """
+    results_data: Dict[str, Any] = {}
+
+    with open(input_path, "rb") as f:
+        parser = ijson.parse(f, use_float=True)
+        try:
+            for prefix, event, value in parser:
+                if prefix != "" or event != "map_key":
+                    continue
+
+                if value == "tests":
+                    results_data["tests"] = _stream_failed_tests(parser)
+                elif value in ("summary", "collectors"):
+                    builder = ijson.ObjectBuilder()
+                    consume_json_value(parser, builder)
+                    results_data[value] = builder.value
+                else:
+                    consume_json_value(parser)
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from e
+
+    return results_data
+
+
+def _stream_failed_tests(parser: Any) -> Any:
+    """Build the failed entries of the "tests" value from an ijson parser."""
+    prefix, event, value = next(parser)
+    if event != "start_array":
+        # Not a list of tests, so keep the value as-is
+        builder = ijson.ObjectBuilder()
+        consume_json_value(chain([(prefix, event, value)], parser), builder)
+        return builder.value
+
+    failed_tests = []
+    for prefix, event, value in parser:
+        if event == "end_array" and prefix == "tests":
+            break
+
+        builder = ijson.ObjectBuilder()
+        consume_json_value(chain([(prefix, event, value)], parser), builder)
+        test = builder.value
+        if isinstance(test, dict) and test.get("outcome") == "failed":
+            failed_tests.append(test)
+
+    return failed_tests
 
 
 if __name__ == "__main__":  # pragma: no cover
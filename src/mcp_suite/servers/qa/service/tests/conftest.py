@@ -0,0 +1,132 @@
+"""Pytest configuration for the QA service tests.
+
+Canonical pytest-json-report payloads are built and written to disk once per
+session. They are read-only; tests that need a variation build a new dict
+from them instead of modifying them.
+
+With --cached, the files are kept under .pytest_cache/d/qa-fixtures and
+recorded in the pytest cache with a hash of their content. Later runs reuse
+a file while the hash still matches instead of writing it again.
+"""
+
+import hashlib
+from pathlib import Path
+from types import MappingProxyType
+
+import orjson
+import pytest
+
+from mcp_suite.servers.qa.models.pytest_models import (
+    PytestFailedTest,
+    PytestResults,
+    PytestSummary,
+)
+from mcp_suite.servers.qa.utils.json_utils import write_file_atomic
+
+_EMPTY_SUMMARY = {
+    "total": 0,
+    "failed": 0,
+    "passed": 0,
+    "skipped": 0,
+    "errors": 0,
+    "xfailed": 0,
+    "xpassed": 0,
+    "collected": 0,
+}
+
+
+def _write_results(pytestconfig, tmp_path_factory, name, results):
+    """Write a results payload to a fresh session directory or the cache."""
+    payload = orjson.dumps(results, default=dict)
+
+    if not pytestconfig.getoption("cached"):
+        path = tmp_path_factory.mktemp(name) / "pytest_results.json"
+        path.write_bytes(payload)
+        return path
+
+    # A changed payload no longer matches the recorded hash and is rewritten,
+    # so a stale file is never read
+    digest = hashlib.sha256(payload).hexdigest()
+    key = f"qa/fixtures/{name}"
+    entry = pytestconfig.cache.get(key, None)
+    if entry and entry.get("hash") == digest and Path(entry["path"]).is_file():
+        return Path(entry["path"])
+
+    # Written atomically, as xdist workers may build the same fixture at once
+    path = pytestconfig.cache.mkdir("qa-fixtures") / f"{name}.json"
+    write_file_atomic(path, payload)
+    pytestconfig.cache.set(key, {"hash": digest, "path": str(path)})
+    return path
+
+
+@pytest.fixture(scope="session")
+def valid_results_dict():
+    """A report with one passing test, one failing test and a passing collector."""
+    return MappingProxyType(
+        {
+            "tests": [
+                {
+                    "nodeid": "test_file.py::test_function",
+                    "outcome": "passed",
+                },
+                {
+                    "nodeid": "test_file.py::test_failing",
+                    "outcome": "failed",
+                    "keywords": {"test_failing": 1},
+                    "longrepr": "AssertionError: expected 1 but got 2",
+                    "duration": 0.01,
+                },
+            ],
+            "collectors": [
+                {
+                    "nodeid": "test_file.py",
+                    "outcome": "passed",
+                }
+            ],
+            "summary": {
+                **_EMPTY_SUMMARY,
+                "total": 2,
+                "failed": 1,
+                "passed": 1,
+                "collected": 2,
+            },
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def valid_results_path(pytestconfig, tmp_path_factory, valid_results_dict):
+    """valid_results_dict written to a results file shared by the session."""
+    return _write_results(
+        pytestconfig, tmp_path_factory, "valid_results", valid_results_dict
+    )
+
+
+@pytest.fixture(scope="session")
+def expected_valid_results():
+    """The PytestResults that processing valid_results_dict should produce."""
+    return PytestResults(
+        summary=PytestSummary(total=2, failed=1, passed=1, collected=2),
+        failed_tests=[
+            PytestFailedTest(
+                nodeid="test_file.py::test_failing",
+                outcome="failed",
+                longrepr="AssertionError: expected 1 but got 2",
+                duration=0.01,
+            )
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def empty_results_dict():
+    """A report for a run that collected no tests."""
+    return MappingProxyType({"tests": [], "summary": _EMPTY_SUMMARY})
+
+
+@pytest.fixture(scope="session")
+def empty_results_path(pytestconfig, tmp_path_factory, empty_results_dict):
+    """empty_results_dict written to a results file shared by the session."""
+    return _write_results(
+        pytestconfig, tmp_path_factory, "empty_results", empty_results_dict
+    )
@@ -1,31 +1,26 @@
 """Tests for the coverage service module."""
 
 import json
-from unittest.mock import mock_open, patch
+from types import MappingProxyType
+from typing import Final
+from unittest.mock import patch
 
+import orjson
 import pytest
 
+from mcp_suite.servers.qa.service import coverage
 from mcp_suite.servers.qa.service.coverage import (
     CoverageIssue,
     _process_section,
+    process_coverage_dict,
     process_coverage_json,
     process_file_data,
 )
 
-# Remove logging test and fixture
-# @pytest.fixture
-# def capture_logs():
-#     """Fixture to capture and test logging calls."""
-#     mock_logger = MagicMock()
-#     with patch("mcp_suite.servers.qa.service.coverage.logger", mock_logger):
-#         yield mock_logger
-
-
-class TestCoverageService:
-    """Test class for the coverage service module."""
-
-    # Sample coverage data for testing
-    SAMPLE_COVERAGE_DATA = {
+# Sample coverage data for testing. It is shared by every test, so the outer
+# mapping is read-only; it holds lists, as a decoded report does
+SAMPLE_COVERAGE_DATA: Final = MappingProxyType(
+    {
         "files": {
             "src/mcp_suite/example.py": {
                 "missing_lines": [10, 20, 30],
@@ -49,13 +44,52 @@ class TestCoverageService:
             },
         }
     }
+)
+
+
+def _dumps(data):
+    """Serialize test data to a JSON string with orjson."""
+    # orjson needs help with MappingProxyType
+    return orjson.dumps(data, default=dict).decode()
+
+
+# Every report the tests read from a file, serialized once at import
+SERIALIZED_SAMPLES: Final = MappingProxyType(
+    {
+        "sample": _dumps(SAMPLE_COVERAGE_DATA),
+        "invalid": "invalid json",
+        "truncated": '{"files": {"example.py": {"missing_lines": [1,',
+    }
+)
+
+
+@pytest.fixture
+def write_report(tmp_path):
+    """Write a serialized sample report to a file and return its path."""
+
+    def write(name):
+        report = tmp_path / "coverage.json"
+        report.write_text(SERIALIZED_SAMPLES[name])
+        return str(report)
+
+    return write
 
-    def test_process_coverage_json(self):
-        """Test processing coverage JSON data."""
-        mock_json = json.dumps(self.SAMPLE_COVERAGE_DATA)
 
-        with patch("builtins.open", mock_open(read_data=mock_json)):
-            issues = process_coverage_json("fake_path.json")
+# Remove logging test and fixture
+# @pytest.fixture
+# def capture_logs():
+#     """Fixture to capture and test logging calls."""
+#     mock_logger = MagicMock()
+#     with patch("mcp_suite.servers.qa.service.coverage.logger", mock_logger):
+#         yield mock_logger
+
+
+class TestCoverageService:
+    """Test class for the coverage service module."""
+
+    def test_process_coverage_json(self, write_report):
+        """Test processing coverage JSON data."""
+        issues = process_coverage_json(write_report("sample"))
 
         # We should have 4 issues:
         # 1 for function missing lines, 1 for function missing branches,
@@ -89,8 +123,36 @@ class TestCoverageService:
         assert class_branches_issue.missing_branches[0].source == 5
         assert class_branches_issue.missing_branches[0].target == 6
 
-    def test_process_coverage_json_with_specific_file(self):
-        """Test processing coverage JSON with a specific file filter."""
+    def test_process_coverage_dict_read_only_report(self):
+        """Test processing the read-only sample report without serializing it."""
+        issues = process_coverage_dict(SAMPLE_COVERAGE_DATA)
+
+        assert [(i.section_name, i.missing_lines) for i in issues] == [
+            ("example_function", [15, 25]),
+            ("example_function", None),
+            ("ExampleClass", [35, 45]),
+            ("ExampleClass", None),
+        ]
+        assert [list(map(str, i.missing_branches or ())) for i in issues] == [
+            [],
+            ["1 -> 2", "3 -> 4"],
+            [],
+            ["5 -> 6"],
+        ]
+
+    def test_process_coverage_dict_mapping_file_entry(self):
+        """Test that a file entry of any Mapping type is processed."""
+        file_data = MappingProxyType({"missing_lines": [10, 20]})
+        data = {"files": {"src/mcp_suite/example.py": file_data}}
+
+        issues = process_coverage_dict(data)
+
+        assert [(i.file_path, i.missing_lines) for i in issues] == [
+            ("src/mcp_suite/example.py", [10, 20])
+        ]
+
+    def test_process_coverage_dict_with_specific_file(self):
+        """Test processing coverage data with a specific file filter."""
         # Create a mock coverage data
         mock_data = {
             "files": {
@@ -109,19 +171,11 @@ class TestCoverageService:
             }
         }
 
-        # Mock open to return our mock data
-        mock_open_obj = mock_open(read_data=json.dumps(mock_data))
-
-        with (
-            patch("builtins.open", mock_open_obj),
-            patch(
-                "mcp_suite.servers.qa.service.coverage.process_file_data"
-            ) as mock_process,
-        ):
+        with patch(
+            "mcp_suite.servers.qa.service.coverage.process_file_data"
+        ) as mock_process:
             # Call the function with a specific file
-            _ = process_coverage_json(
-                coverage_file="./reports/coverage.json", specific_file="example1"
-            )
+            _ = process_coverage_dict(mock_data, specific_file="example1")
 
             # Verify process_file_data was called only for the matching file
             assert mock_process.call_count == 1
@@ -129,66 +183,61 @@ class TestCoverageService:
             args, _ = mock_process.call_args
             assert "example1" in args[0]
 
-    def test_process_coverage_json_with_no_matching_files(self):
-        """Test processing coverage JSON with no matching files."""
-        # Create a mock coverage data
-        mock_data = {
-            "files": {
-                "src/mcp_suite/example1.py": {
-                    "missing_lines": [10, 20],
-                    "sections": {},
-                    "functions": {},
-                    "classes": {},
-                }
-            }
+    def test_process_coverage_dict_with_specific_file_many_files(self):
+        """Test the specific file filter on a report with many files."""
+        files = {
+            f"src/mcp_suite/module{i}.py": {"missing_lines": [i + 1]}
+            for i in range(10_000)
         }
 
-        # Mock open to return our mock data
-        mock_open_obj = mock_open(read_data=json.dumps(mock_data))
-
-        with patch("builtins.open", mock_open_obj):
-            # Call the function with a non-matching file
-            result = process_coverage_json(
-                coverage_file="./reports/coverage.json", specific_file="nonexistent"
-            )
-
-            # Verify an empty list is returned
-            assert result == []
-
-    def test_process_coverage_json_with_invalid_data_structure(self):
-        """Test processing coverage JSON with invalid data structure."""
-        # Test with non-dictionary data
-        mock_data_non_dict = "not a dictionary"
-        mock_open_obj = mock_open(read_data=json.dumps(mock_data_non_dict))
-
-        with patch("builtins.open", mock_open_obj):
-            result = process_coverage_json()
-            assert result == []
-
-        # Test with missing 'files' key
-        mock_data_no_files = {"not_files": {}}
-        mock_open_obj = mock_open(read_data=json.dumps(mock_data_no_files))
-
-        with patch("builtins.open", mock_open_obj):
-            result = process_coverage_json()
-            assert result == []
-
-    def test_process_coverage_json_with_file_not_found(self):
-        """Test processing coverage JSON with file not found error."""
-        with patch("builtins.open", side_effect=FileNotFoundError):
-            with pytest.raises(FileNotFoundError):
-                process_coverage_json()
-
-    def test_process_coverage_json_with_invalid_json(self):
-        """Test processing coverage JSON with invalid JSON."""
-        mock_open_obj = mock_open(read_data="invalid json")
-
-        with patch("builtins.open", mock_open_obj):
-            with pytest.raises(json.JSONDecodeError):
-                process_coverage_json()
+        issues = process_coverage_dict({"files": files}, specific_file="module4242.py")
+
+        assert len(issues) == 1
+        assert issues[0].file_path == "src/mcp_suite/module4242.py"
+        assert issues[0].missing_lines == [4243]
+
+    @pytest.mark.parametrize(
+        "data,specific_file",
+        [
+            pytest.param("not a dictionary", "", id="non_dict_report"),
+            pytest.param({"not_files": {}}, "", id="missing_files_key"),
+            pytest.param(
+                {"files": {"src/mcp_suite/example.py": "not a dictionary"}},
+                "",
+                id="non_dict_file_data",
+            ),
+            pytest.param(
+                {"files": {"src/mcp_suite/example1.py": {"missing_lines": [1]}}},
+                "nonexistent",
+                id="no_matching_files",
+            ),
+            pytest.param({"files": ["not", "a", "dictionary"]}, "", id="list_files"),
+        ],
+    )
+    def test_process_coverage_dict_malformed(self, data, specific_file):
+        """Test reports that are malformed or have nothing to match."""
+        assert process_coverage_dict(data, specific_file=specific_file) == []
+
+    def test_process_coverage_json_file_not_found(self, tmp_path):
+        """Test that a missing coverage file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            process_coverage_json(str(tmp_path / "missing.json"))
+
+    def test_process_coverage_json_invalid_json(self, write_report):
+        """Test that a coverage file with invalid JSON raises JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            process_coverage_json(write_report("invalid"))
+
+    def test_process_coverage_json_general_exception(self, write_report):
+        """Test that any other error while reading the report returns no issues."""
+        with patch(
+            "mcp_suite.servers.qa.service.coverage.load_json_file",
+            side_effect=Exception("General error"),
+        ):
+            assert process_coverage_json(write_report("sample")) == []
 
-    def test_process_coverage_json_with_exception_in_processing(self):
-        """Test processing coverage JSON with exception in processing."""
+    def test_process_coverage_dict_with_exception_in_processing(self):
+        """Test processing coverage data with exception in processing."""
         # Create a mock coverage data
         mock_data = {
             "files": {
@@ -201,89 +250,33 @@ class TestCoverageService:
             }
         }
 
-        # Mock open to return our mock data
-        mock_open_obj = mock_open(read_data=json.dumps(mock_data))
-
-        with (
-            patch("builtins.open", mock_open_obj),
-            patch(
-                "mcp_suite.servers.qa.service.coverage.process_file_data",
-                side_effect=Exception("Test exception"),
-            ),
+        with patch(
+            "mcp_suite.servers.qa.service.coverage.process_file_data",
+            side_effect=Exception("Test exception"),
         ):
             # Call the function
-            result = process_coverage_json()
+            result = process_coverage_dict(mock_data)
 
             # Verify an empty list is returned
             assert result == []
 
-    def test_process_coverage_json_with_non_dict_file_data(self):
-        """Test processing coverage JSON with non-dictionary file data."""
-        # Create a mock coverage data with non-dictionary file data
-        mock_data = {"files": {"src/mcp_suite/example.py": "not a dictionary"}}
-
-        # Mock open to return our mock data
-        mock_open_obj = mock_open(read_data=json.dumps(mock_data))
-
-        with patch("builtins.open", mock_open_obj):
-            # Call the function
-            result = process_coverage_json()
-
-            # Verify an empty list is returned since the file data is skipped
-            assert result == []
-
-    def test_process_coverage_json_with_specific_file_no_matches(self):
-        """Test processing coverage JSON data with a specific file filter.
+    def test_process_coverage_dict_with_specific_file_no_matches(self):
+        """Test processing coverage data with a specific file filter.
 
         Tests the case where no files match the filter.
         """
-        # Create a sample with files that don't match the filter
-        sample_data = {
-            "files": {
-                "src/mcp_suite/example.py": {
-                    "missing_lines": [10, 20],
-                    "functions": {
-                        "example_function": {
-                            "missing_lines": [15, 25],
-                        }
-                    },
-                    "classes": {},
-                },
-            }
-        }
-
-        mock_json = json.dumps(sample_data)
-
-        with patch("builtins.open", mock_open(read_data=mock_json)):
-            issues = process_coverage_json(
-                "fake_path.json", specific_file="nonexistent_file.py"
-            )
+        issues = process_coverage_dict(
+            SAMPLE_COVERAGE_DATA, specific_file="nonexistent_file.py"
+        )
 
         # We should have 0 issues since the file doesn't match the filter
         assert len(issues) == 0
 
-    def test_process_coverage_json_with_specific_file_exception(self):
-        """Test processing coverage JSON data with a specific file filter.
+    def test_process_coverage_dict_with_specific_file_exception(self):
+        """Test processing coverage data with a specific file filter.
 
         Tests the case where processing raises an exception.
         """
-        # Create a sample with files that match the filter
-        sample_data = {
-            "files": {
-                "src/mcp_suite/example.py": {
-                    "missing_lines": [10, 20],
-                    "functions": {
-                        "example_function": {
-                            "missing_lines": [15, 25],
-                        }
-                    },
-                    "classes": {},
-                },
-            }
-        }
-
-        mock_json = json.dumps(sample_data)
-
         # Mock process_file_data to raise an exception
         # only when called with specific_file
         original_process_file_data = process_file_data
@@ -293,94 +286,89 @@ class TestCoverageService:
                 raise Exception("Test exception")
             return original_process_file_data(file_path, file_data, result)
 
-        with patch("builtins.open", mock_open(read_data=mock_json)):
-            with patch(
-                "mcp_suite.servers.qa.service.coverage.process_file_data",
-                side_effect=mock_process_file_data,
-            ):
-                issues = process_coverage_json(
-                    "fake_path.json", specific_file="example.py"
-                )
+        with patch(
+            "mcp_suite.servers.qa.service.coverage.process_file_data",
+            side_effect=mock_process_file_data,
+        ):
+            issues = process_coverage_dict(
+                SAMPLE_COVERAGE_DATA, specific_file="example.py"
+            )
 
         # We should have 0 issues since an exception was raised during processing
         assert issues == []
 
-    def test_process_file_data(self):
-        """Test processing file data with various combinations of data."""
-        # Create a sample file data with functions and classes
-        file_data = {
-            "missing_lines": [10, 20],
-            "functions": {
-                "example_function": {
-                    "missing_lines": [15, 25],
-                    "missing_branches": [[1, 2], [3, 4]],
+    @pytest.mark.parametrize(
+        "file_data,expected",
+        [
+            pytest.param(
+                {
+                    "missing_lines": [10, 20],
+                    "functions": {
+                        "example_function": {
+                            "missing_lines": [15, 25],
+                            "missing_branches": [[1, 2], [3, 4]],
+                        },
+                        "another_function": {
+                            "missing_lines": [],
+                            "missing_branches": [],
+                        },
+                        "non_dict_function": "This is not a dictionary",
+                    },
+                    "classes": {
+                        "ExampleClass": {
+                            "missing_lines": [35, 45],
+                            "missing_branches": [[5, 6]],
+                        },
+                        "AnotherClass": {
+                            "missing_lines": [],
+                            "missing_branches": [],
+                        },
+                        "non_dict_class": "This is not a dictionary",
+                    },
                 },
-                "another_function": {
+                # Separate issues for missing lines and missing branches of
+                # each function and class that has them
+                [
+                    ("example_function", [15, 25], 0),
+                    ("example_function", None, 2),
+                    ("ExampleClass", [35, 45], 0),
+                    ("ExampleClass", None, 1),
+                ],
+                id="functions_and_classes",
+            ),
+            pytest.param(
+                {
                     "missing_lines": [],
                     "missing_branches": [],
+                    "functions": {},
+                    "classes": {},
                 },
-                "non_dict_function": "This is not a dictionary",
-            },
-            "classes": {
-                "ExampleClass": {
-                    "missing_lines": [35, 45],
-                    "missing_branches": [[5, 6]],
-                },
-                "AnotherClass": {
-                    "missing_lines": [],
-                    "missing_branches": [],
+                # No issues for a file with 100% coverage
+                [],
+                id="full_coverage",
+            ),
+            pytest.param(
+                {
+                    "missing_lines": [10, 20],
+                    "missing_branches": {"1": [2, 3]},
                 },
-                "non_dict_class": "This is not a dictionary",
-            },
-        }
-
+                # One file-level issue when there are no sections, functions,
+                # or classes
+                [("", [10, 20], 1)],
+                id="file_level_only",
+            ),
+        ],
+    )
+    def test_process_file_data(self, file_data, expected):
+        """Test processing file data with various combinations of data."""
         result = []
         process_file_data("src/mcp_suite/example.py", file_data, result)
 
-        # We should have issues for:
-        # 1. example_function missing lines
-        # 2. example_function missing branches
-        # 3. ExampleClass missing lines
-        # 4. ExampleClass missing branches
-        assert len(result) == 4
-
-        # Verify function issues
-        function_issues = [i for i in result if i.section_name == "example_function"]
-        assert len(function_issues) == 2
-
-        # Verify class issues
-        class_issues = [i for i in result if i.section_name == "ExampleClass"]
-        assert len(class_issues) == 2
-
-        # Test with 100% coverage file data
-        file_data_100_percent = {
-            "missing_lines": [],
-            "missing_branches": [],
-            "functions": {},
-            "classes": {},
-        }
-
-        result = []
-        process_file_data("src/mcp_suite/example.py", file_data_100_percent, result)
-
-        # We should have no issues for a file with 100% coverage
-        assert len(result) == 0
-
-        # Test with no sections, functions, or classes
-        file_data_basic = {
-            "missing_lines": [10, 20],
-            "missing_branches": {"1": [2, 3]},
-        }
-
-        result = []
-        process_file_data("src/mcp_suite/example.py", file_data_basic, result)
-
-        # We should have one issue for the basic file
-        assert len(result) == 1
-        assert result[0].file_path == "src/mcp_suite/example.py"
-        assert result[0].section_name == ""
-        assert result[0].missing_lines == [10, 20]
-        assert len(result[0].missing_branches) == 1
+        assert all(i.file_path == "src/mcp_suite/example.py" for i in result)
+        assert [
+            (i.section_name, i.missing_lines, len(i.missing_branches or ()))
+            for i in result
+        ] == expected
 
     def test_process_file_data_exception(self):
         """Test processing file data that raises an exception."""
@@ -446,6 +434,32 @@ class TestCoverageService:
         assert result[0].section_name == ""
         assert result[0].missing_lines == [10, 20]
 
+    @pytest.mark.parametrize(
+        "dict_count,non_dict_count",
+        [(0, 3), (1, 3), (2, 2), (3, 1), (3, 0)],
+    )
+    def test_process_file_data_mixed_entries(self, dict_count, non_dict_count):
+        """Test that only dictionary entries produce section issues."""
+        functions = {
+            f"function_{i}": {"missing_lines": [i + 1]} for i in range(dict_count)
+        }
+        functions.update(
+            {f"non_dict_{i}": "This is not a dictionary" for i in range(non_dict_count)}
+        )
+        file_data = {"missing_lines": [10, 20], "functions": functions}
+
+        result = []
+        process_file_data("src/mcp_suite/example.py", file_data, result)
+
+        if dict_count:
+            assert [i.section_name for i in result] == [
+                f"function_{i}" for i in range(dict_count)
+            ]
+        else:
+            # Only the file-level issue is reported
+            assert len(result) == 1
+            assert result[0].section_name == ""
+
     def test_process_file_data_with_empty_sections(self):
         """Test processing file data with empty sections."""
         # Create a sample file data with empty sections
@@ -502,16 +516,6 @@ class TestCoverageService:
             assert result[0].section_name == "test_section"
             assert result[0].missing_lines == [30, 40]
 
-    def test_process_coverage_json_with_general_exception(self):
-        """Test processing coverage JSON with a general exception."""
-        # Mock open to raise a general exception
-        with patch("builtins.open", side_effect=Exception("General error")):
-            # Call the function
-            result = process_coverage_json()
-
-            # Verify an empty list is returned
-            assert result == []
-
     def test_process_section_with_missing_lines_and_branches(self):
         """Test processing a section with both missing lines and branches."""
         file_path = "src/mcp_suite/example.py"
@@ -541,6 +545,21 @@ class TestCoverageService:
         assert branches_issue.missing_branches[0].source == 1
         assert branches_issue.missing_branches[0].target == 2
 
+    def test_process_section_issues_match_validated_models(self):
+        """Test that issues built without validation equal validated ones."""
+        sections = {
+            "test_section": {
+                "missing_lines": [10, 20],
+                "missing_branches": [[1, 2], [3, 4]],
+            }
+        }
+
+        result = _process_section("src/mcp_suite/example.py", sections)
+
+        assert result == [
+            CoverageIssue.model_validate(issue.model_dump()) for issue in result
+        ]
+
     def test_process_section_with_no_issues(self):
         """Test processing a section with no missing lines or branches."""
         file_path = "src/mcp_suite/example.py"
@@ -593,3 +612,43 @@ class TestCoverageService:
         assert len(result[0].missing_branches) == 2
         assert result[0].missing_branches[0].source == 1
         assert result[0].missing_branches[0].target == 2
+
+    def test_process_section_skips_invalid_entries(self):
+        """Test that non-dict sections and malformed branches produce no issues."""
+        sections = {
+            "non_dict_section": "This is not a dictionary",
+            "bad_branches": {"missing_branches": [[1], [2, 3, 4]]},
+        }
+
+        result = _process_section("src/mcp_suite/example.py", sections)
+
+        assert result == []
+
+    def test_process_coverage_json_streaming(self, tmp_path, monkeypatch):
+        """Test that streamed reports produce the same issues as loaded ones."""
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text(SERIALIZED_SAMPLES["sample"])
+
+        expected = process_coverage_json(str(coverage_file))
+        expected_filtered = process_coverage_json(
+            str(coverage_file), specific_file="example.py"
+        )
+
+        monkeypatch.setattr(coverage, "STREAM_THRESHOLD", 0)
+        assert process_coverage_json(str(coverage_file)) == expected
+        assert (
+            process_coverage_json(str(coverage_file), specific_file="example.py")
+            == expected_filtered
+        )
+        assert (
+            process_coverage_json(str(coverage_file), specific_file="nonexistent") == []
+        )
+
+    def test_process_coverage_json_streaming_invalid_json(self, tmp_path, monkeypatch):
+        """Test that streamed reports with invalid JSON raise JSONDecodeError."""
+        coverage_file = tmp_path / "coverage.json"
+        coverage_file.write_text(SERIALIZED_SAMPLES["truncated"])
+
+        monkeypatch.setattr(coverage, "STREAM_THRESHOLD", 0)
+        with pytest.raises(json.JSONDecodeError):
+            process_coverage_json(str(coverage_file))
@@ -1,91 +1,79 @@
 """Tests for the pytest module."""
 
-import json
-from unittest.mock import mock_open, patch
+import os
+from pathlib import Path
+from unittest.mock import patch
 
+import orjson
+import pytest
+
+from mcp_suite.servers.qa import LOG_FILE, logger
 from mcp_suite.servers.qa.config import ReportPaths
 from mcp_suite.servers.qa.models.pytest_models import (
+    PYTEST_RESULTS_ADAPTER,
     PytestResults,
 )
+from mcp_suite.servers.qa.service import pytest as pytest_service
 from mcp_suite.servers.qa.service.pytest import (
     process_pytest_results,
+    process_pytest_results_many,
 )
 
 
+@pytest.fixture(autouse=True)
+def clear_output_digests():
+    """Start every test with an empty output digest cache."""
+    pytest_service._OUTPUT_DIGESTS.clear()
+    yield
+    pytest_service._OUTPUT_DIGESTS.clear()
+
+
+@pytest.fixture
+def write_default_results(tmp_path, monkeypatch):
+    """
+    Run the test from tmp_path and return a writer for the default input.
+
+    process_pytest_results() then reads and writes real files at its default
+    relative paths, with no patching of open().
+    """
+    monkeypatch.chdir(tmp_path)
+    ReportPaths.PYTEST_RESULTS.path.parent.mkdir()
+    return ReportPaths.PYTEST_RESULTS.path.write_bytes
+
+
 class TestProcessPytestResults:
     """Tests for the process_pytest_results function."""
 
-    def test_process_valid_results(self, tmp_path):
+    def test_process_valid_results(
+        self, tmp_path, valid_results_path, expected_valid_results
+    ):
         """Test processing valid pytest results."""
-        # Setup - create a mock pytest results file
-        mock_results = {
-            "tests": [
-                {
-                    "nodeid": "test_file.py::test_function",
-                    "outcome": "passed",
-                },
-                {
-                    "nodeid": "test_file.py::test_failing",
-                    "outcome": "failed",
-                    "keywords": {"test_failing": 1},
-                    "longrepr": "AssertionError: expected 1 but got 2",
-                    "duration": 0.01,
-                },
-            ],
-            "collectors": [
-                {
-                    "nodeid": "test_file.py",
-                    "outcome": "passed",
-                }
-            ],
-            "summary": {
-                "total": 2,
-                "failed": 1,
-                "passed": 1,
-                "skipped": 0,
-                "errors": 0,
-                "xfailed": 0,
-                "xpassed": 0,
-                "collected": 2,
-            },
-        }
-
-        # Create temporary input and output files
-        input_file = tmp_path / "pytest_results.json"
         output_file = tmp_path / "failed_tests.json"
 
-        with open(input_file, "w") as f:
-            json.dump(mock_results, f)
-
         # Exercise - call the function
-        result = process_pytest_results(input_file, output_file)
+        result = process_pytest_results(valid_results_path, output_file)
 
-        # Verify - check that the result is as expected
-        assert isinstance(result, PytestResults)
-        assert result.summary.total == 2
-        assert result.summary.failed == 1
-        assert result.summary.passed == 1
-        assert len(result.failed_tests) == 1
-        assert result.failed_tests[0].nodeid == "test_file.py::test_failing"
-        assert result.failed_tests[0].outcome == "failed"
-        assert result.failed_tests[0].longrepr == "AssertionError: expected 1 but got 2"
-        assert result.failed_tests[0].duration == 0.01
-        assert "keywords" not in result.failed_tests[0].model_dump()
-        assert len(result.failed_collections) == 0
+        # Verify - the keywords of the failed test are dropped, and the output
+        # file holds exactly the returned results
+        assert result == expected_valid_results
+        assert "keywords" not in result.failed_tests[0].model_fields_set
+        assert output_file.read_bytes() == expected_valid_results.json_bytes
 
-        # Verify the output file was created
-        assert output_file.exists()
-        with open(output_file, "r") as f:
-            output_data = json.loads(f.read())
-            assert output_data["summary"]["total"] == 2
-            assert output_data["summary"]["failed"] == 1
-            assert len(output_data["failed_tests"]) == 1
+    def test_output_file_round_trips(self, tmp_path, valid_results_path):
+        """Test that the output file validates back into the same results."""
+        output_file = tmp_path / "failed_tests.json"
+
+        result = process_pytest_results(valid_results_path, output_file)
 
-    def test_process_with_collection_failures(self):
+        assert PYTEST_RESULTS_ADAPTER.validate_json(output_file.read_bytes()) == result
+
+    def test_process_with_collection_failures(
+        self, empty_results_dict, write_default_results
+    ):
         """Test processing results with collection failures."""
         # Setup - create mock data with collection failures
         mock_results = {
-            "tests": [],
+            **empty_results_dict,
             "collectors": [
                 {
                     "nodeid": "test_file.py",
@@ -93,28 +81,13 @@ class TestProcessPytestResults:
                     "longrepr": "ImportError: No module named 'missing_module'",
                 }
             ],
-            "summary": {
-                "total": 0,
-                "failed": 0,
-                "passed": 0,
-                "skipped": 0,
-                "errors": 1,
-                "xfailed": 0,
-                "xpassed": 0,
-                "collected": 0,
-            },
+            "summary": {**empty_results_dict["summary"], "errors": 1},
         }
 
-        # Mock the open function to return our mock data
-        mock_file = mock_open(read_data=json.dumps(mock_results))
+        write_default_results(orjson.dumps(mock_results))
 
-        with (
-            patch("builtins.open", mock_file),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
-
-            # Exercise - call the function
-            result = process_pytest_results()
+        # Exercise - call the function
+        result = process_pytest_results()
 
         # Verify - check that the result is as expected
         assert isinstance(result, PytestResults)
@@ -129,33 +102,15 @@ class TestProcessPytestResults:
         )
         assert len(result.failed_tests) == 0
 
-    def test_missing_tests_key(self):
+    def test_missing_tests_key(self, empty_results_dict, write_default_results):
         """Test handling of missing 'tests' key in results."""
         # Setup - create mock data with missing 'tests' key
-        mock_results = {
-            "collectors": [],
-            "summary": {
-                "total": 0,
-                "failed": 0,
-                "passed": 0,
-                "skipped": 0,
-                "errors": 0,
-                "xfailed": 0,
-                "xpassed": 0,
-                "collected": 0,
-            },
-        }
-
-        # Mock the open function to return our mock data
-        mock_file = mock_open(read_data=json.dumps(mock_results))
+        mock_results = {"collectors": [], "summary": empty_results_dict["summary"]}
 
-        with (
-            patch("builtins.open", mock_file),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
+        write_default_results(orjson.dumps(mock_results))
 
-            # Exercise - call the function
-            result = process_pytest_results()
+        # Exercise - call the function
+        result = process_pytest_results()
 
         # Verify - check that the result is as expected
         assert isinstance(result, PytestResults)
@@ -167,16 +122,13 @@ class TestProcessPytestResults:
         assert len(result.failed_collections) == 0
         assert len(result.failed_tests) == 0
 
-    def test_file_not_found(self):
+    def test_file_not_found(self, tmp_path, monkeypatch):
         """Test handling of file not found error."""
-        # Mock the open function to raise FileNotFoundError
-        with (
-            patch("builtins.open", side_effect=FileNotFoundError()),
-            patch("pathlib.Path.exists", return_value=False),
-        ):
+        # Run from an empty directory, so the default input file is missing
+        monkeypatch.chdir(tmp_path)
 
-            # Exercise - call the function
-            result = process_pytest_results()
+        # Exercise - call the function
+        result = process_pytest_results()
 
         # Verify - check that the result is as expected
         assert isinstance(result, PytestResults)
@@ -185,18 +137,12 @@ class TestProcessPytestResults:
         assert len(result.failed_collections) == 0
         assert len(result.failed_tests) == 0
 
-    def test_invalid_json(self):
+    def test_invalid_json(self, write_default_results):
         """Test handling of invalid JSON in the input file."""
-        # Mock the open function to return invalid JSON
-        mock_file = mock_open(read_data="invalid json")
+        write_default_results(b"invalid json")
 
-        with (
-            patch("builtins.open", mock_file),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
-
-            # Exercise - call the function
-            result = process_pytest_results()
+        # Exercise - call the function
+        result = process_pytest_results()
 
         # Verify - check that the result is as expected
         assert isinstance(result, PytestResults)
@@ -208,11 +154,7 @@ class TestProcessPytestResults:
     def test_general_exception(self):
         """Test handling of general exceptions."""
         # Mock the open function to raise a general exception
-        with (
-            patch("builtins.open", side_effect=Exception("Test exception")),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
-
+        with patch("builtins.open", side_effect=Exception("Test exception")):
             # Exercise - call the function
             result = process_pytest_results()
 
@@ -223,32 +165,12 @@ class TestProcessPytestResults:
         assert len(result.failed_collections) == 0
         assert len(result.failed_tests) == 0
 
-    def test_string_path_conversion(self, tmp_path):
+    def test_string_path_conversion(self, tmp_path, empty_results_path):
         """Test conversion of string paths to Path objects."""
-        # Setup - create a mock pytest results file
-        mock_results = {
-            "tests": [],
-            "summary": {
-                "total": 0,
-                "failed": 0,
-                "passed": 0,
-                "skipped": 0,
-                "errors": 0,
-                "xfailed": 0,
-                "xpassed": 0,
-                "collected": 0,
-            },
-        }
-
-        # Create temporary input and output files
-        input_file = tmp_path / "pytest_results.json"
         output_file = tmp_path / "failed_tests.json"
 
-        with open(input_file, "w") as f:
-            json.dump(mock_results, f)
-
         # Exercise - call the function with string paths
-        result = process_pytest_results(str(input_file), str(output_file))
+        result = process_pytest_results(str(empty_results_path), str(output_file))
 
         # Verify - check that the result is as expected
         assert isinstance(result, PytestResults)
@@ -259,56 +181,31 @@ class TestProcessPytestResults:
         # Verify the output file was created
         assert output_file.exists()
 
-    def test_write_error(self, tmp_path):
+    def test_write_error(self, tmp_path, empty_results_path):
         """Test handling of errors when writing the output file."""
-        # Setup - create a mock pytest results file
-        mock_results = {
-            "tests": [],
-            "summary": {
-                "total": 0,
-                "failed": 0,
-                "passed": 0,
-                "skipped": 0,
-                "errors": 0,
-                "xfailed": 0,
-                "xpassed": 0,
-                "collected": 0,
-            },
-        }
-
-        # Create temporary input file
-        input_file = tmp_path / "pytest_results.json"
-
-        with open(input_file, "w") as f:
-            json.dump(mock_results, f)
-
-        # Mock the open function for writing to raise an exception
-        original_open = open
-
-        def mock_open_with_write_error(*args, **kwargs):
-            if args[0] == input_file and "r" in kwargs.get("mode", "r"):
-                return original_open(*args, **kwargs)
-            else:
-                raise PermissionError("Permission denied")
-
-        with patch("builtins.open", side_effect=mock_open_with_write_error):
-            # Exercise - call the function
-            result = process_pytest_results(
-                input_file, "/nonexistent/path/failed_tests.json"
-            )
+        output_file = tmp_path / "failed_tests.json"
 
-        # Verify - check that the result is as expected
-        assert isinstance(result, PytestResults)
+        # Fail the write itself, inside write_file_atomic
+        with patch(
+            "mcp_suite.servers.qa.utils.json_utils.tempfile.mkstemp",
+            side_effect=PermissionError("Permission denied"),
+        ) as mock_mkstemp:
+            result = process_pytest_results(empty_results_path, output_file)
+
+        # Verify - the input was read and parsed, and only the write failed
+        mock_mkstemp.assert_called_once()
+        assert mock_mkstemp.call_args.kwargs["dir"] == os.fspath(tmp_path)
+        assert result.error == "Error processing pytest results: Permission denied"
         assert result.summary.total == 0
-        assert len(result.failed_tests) == 0
-        assert len(result.failed_collections) == 0
-        # The function should still return a result even if writing fails
+        assert not output_file.exists()
 
-    def test_process_with_collectors_dict(self):
+    def test_process_with_collectors_dict(
+        self, empty_results_dict, write_default_results
+    ):
         """Test processing results with collectors as a dictionary."""
         # Setup - create mock data with collectors as a dictionary
         mock_results = {
-            "tests": [],
+            **empty_results_dict,
             "collectors": {
                 "errors": [
                     {
@@ -317,28 +214,13 @@ class TestProcessPytestResults:
                     }
                 ]
             },
-            "summary": {
-                "total": 0,
-                "failed": 0,
-                "passed": 0,
-                "skipped": 0,
-                "errors": 1,
-                "xfailed": 0,
-                "xpassed": 0,
-                "collected": 0,
-            },
+            "summary": {**empty_results_dict["summary"], "errors": 1},
         }
 
-        # Mock the open function to return our mock data
-        mock_file = mock_open(read_data=json.dumps(mock_results))
-
-        with (
-            patch("builtins.open", mock_file),
-            patch("pathlib.Path.exists", return_value=True),
-        ):
+        write_default_results(orjson.dumps(mock_results))
 
-            # Exercise - call the function
-            result = process_pytest_results()
+        # Exercise - call the function
+        result = process_pytest_results()
 
         # Verify - check that the result is as expected
         assert isinstance(result, PytestResults)
@@ -351,3 +233,155 @@ class TestProcessPytestResults:
             result.failed_collections[0].longrepr
             == "ImportError: No module named 'missing_module'"
         )
+
+    def test_streaming_matches_loaded_results(self, tmp_path, monkeypatch):
+        """Test that streamed input produces the same results as loaded input."""
+        input_file = tmp_path / "pytest_results.json"
+        input_file.write_bytes(
+            orjson.dumps(
+                {
+                    "created": 1.5,
+                    "environment": {"Python": "3.13"},
+                    "tests": [
+                        {"nodeid": "test_file.py::test_ok", "outcome": "passed"},
+                        {
+                            "nodeid": "test_file.py::test_failing",
+                            "outcome": "failed",
+                            "lineno": 3,
+                            "call": {"duration": 0.5, "longrepr": "boom"},
+                        },
+                    ],
+                    "collectors": [
+                        {"nodeid": "bad.py", "outcome": "failed", "longrepr": "x"}
+                    ],
+                    "summary": {"total": 2, "failed": 1, "passed": 1},
+                }
+            )
+        )
+
+        expected = process_pytest_results(input_file, tmp_path / "loaded.json")
+
+        monkeypatch.setattr(pytest_service, "STREAM_THRESHOLD", 0)
+        with patch.object(pytest_service, "load_json_file") as mock_load:
+            result = process_pytest_results(input_file, tmp_path / "streamed.json")
+
+        mock_load.assert_not_called()
+        assert result == expected
+        assert len(result.failed_tests) == 1
+        assert len(result.failed_collections) == 1
+
+    def test_streaming_invalid_json(self, tmp_path, monkeypatch):
+        """Test that streamed input with invalid JSON returns an error result."""
+        input_file = tmp_path / "pytest_results.json"
+        input_file.write_text('{"tests": [{"outcome": ')
+
+        monkeypatch.setattr(pytest_service, "STREAM_THRESHOLD", 0)
+        result = process_pytest_results(input_file, tmp_path / "failed_tests.json")
+
+        assert "Error: Invalid JSON" in result.error
+
+    def test_green_summary_skips_tests_scan(self, tmp_path):
+        """Test that a summary with no failures skips scanning the tests list."""
+        input_file = tmp_path / "pytest_results.json"
+        input_file.write_bytes(
+            orjson.dumps(
+                {
+                    # Inconsistent on purpose: the summary is trusted over tests
+                    "tests": [{"nodeid": "test_file.py::test_x", "outcome": "failed"}],
+                    "summary": {"total": 1, "passed": 1},
+                }
+            )
+        )
+
+        result = process_pytest_results(input_file, tmp_path / "failed_tests.json")
+
+        assert result.failed_tests == []
+        assert result.summary.passed == 1
+
+    def test_unchanged_output_not_rewritten(self, tmp_path):
+        """Test that identical results are not written to the output twice."""
+        output_file = tmp_path / "failed_tests.json"
+        results = {"tests": [], "summary": {"total": 1, "passed": 1}}
+        first_input = tmp_path / "first.json"
+        second_input = tmp_path / "second.json"
+        first_input.write_bytes(orjson.dumps(results))
+        second_input.write_bytes(orjson.dumps(results))
+
+        process_pytest_results(first_input, output_file)
+        with patch.object(pytest_service, "write_file_atomic") as mock_write:
+            process_pytest_results(second_input, output_file)
+        mock_write.assert_not_called()
+
+        # Once the file is modified externally it is written again
+        output_file.write_text("{}")
+        third_input = tmp_path / "third.json"
+        third_input.write_bytes(orjson.dumps(results))
+        process_pytest_results(third_input, output_file)
+        assert orjson.loads(output_file.read_bytes())["summary"]["total"] == 1
+
+    def test_rewritten_input_with_same_stat_is_reprocessed(self, tmp_path):
+        """Test that a rewrite the timestamps cannot see is still picked up."""
+        input_file = tmp_path / "pytest_results.json"
+        output_file = tmp_path / "failed_tests.json"
+        first = {"tests": [], "summary": {"total": 1, "passed": 1}}
+        second = {"tests": [], "summary": {"total": 1, "failed": 1}}
+        payloads = [orjson.dumps(first), orjson.dumps(second)]
+        assert len(payloads[0]) == len(payloads[1])
+
+        input_file.write_bytes(payloads[0])
+        stat = input_file.stat()
+        assert process_pytest_results(input_file, output_file).summary.passed == 1
+
+        # Same size and, as on a coarse-grained filesystem, the same mtime
+        input_file.write_bytes(payloads[1])
+        os.utime(input_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        result = process_pytest_results(input_file, output_file)
+
+        assert result.summary.failed == 1
+        assert orjson.loads(output_file.read_bytes())["summary"]["failed"] == 1
+
+
+class TestProcessPytestResultsMany:
+    """Tests for the process_pytest_results_many function."""
+
+    def test_process_many(self, tmp_path):
+        """Test that several results files are processed in order."""
+        pairs = []
+        for index in range(3):
+            input_file = tmp_path / f"pytest_results_{index}.json"
+            summary = {"total": index, "passed": index}
+            input_file.write_bytes(orjson.dumps({"tests": [], "summary": summary}))
+            pairs.append((input_file, tmp_path / f"failed_tests_{index}.json"))
+
+        results = process_pytest_results_many(pairs, max_workers=2)
+
+        assert [result.summary.total for result in results] == [0, 1, 2]
+        assert all(output_file.exists() for _, output_file in pairs)
+
+    def test_process_many_keeps_log(self, tmp_path):
+        """Test that the worker processes do not truncate the log file."""
+        pairs = []
+        for index in range(2):
+            input_file = tmp_path / f"pytest_results_{index}.json"
+            input_file.write_bytes(orjson.dumps({"tests": []}))
+            pairs.append((input_file, tmp_path / f"failed_tests_{index}.json"))
+        marker = f"before batch in {tmp_path}"
+        logger.info(marker)
+
+        process_pytest_results_many(pairs, max_workers=2)
+
+        assert marker in Path(LOG_FILE).read_text()
+
+    def test_process_many_single_pair(self, tmp_path):
+        """Test that a single pair is processed without a worker pool."""
+        input_file = tmp_path / "pytest_results.json"
+        input_file.write_bytes(orjson.dumps({"tests": [], "summary": {"total": 1}}))
+
+        with patch.object(pytest_service, "ProcessPoolExecutor") as mock_pool:
+            results = process_pytest_results_many(
+                [(input_file, tmp_path / "failed_tests.json")]
+            )
+
+        mock_pool.assert_not_called()
+        assert len(results) == 1
+        assert results[0].summary.total == 1
@@ -0,0 +1,45 @@
+"""Tests for the SaagaLint server entry point."""
+
+import importlib
+import sys
+from unittest.mock import patch
+
+import pytest
+
+
+@pytest.fixture
+def main_module():
+    """A freshly imported __main__ module with tool registration mocked."""
+    sys.modules.pop("mcp_suite.servers.qa.__main__", None)
+    with patch(
+        "mcp_suite.servers.qa.tools.register_tools.register_tools"
+    ) as mock_register:
+        module = importlib.import_module("mcp_suite.servers.qa.__main__")
+        yield module, mock_register
+    sys.modules.pop("mcp_suite.servers.qa.__main__", None)
+
+
+class TestMain:
+    """Test cases for building the MCP server."""
+
+    def test_import_does_not_build_server(self, main_module):
+        """Test that importing the module registers no tools."""
+        _, mock_register = main_module
+
+        mock_register.assert_not_called()
+
+    def test_mcp_built_once_on_access(self, main_module):
+        """Test that ``mcp`` is built on first access and then reused."""
+        module, mock_register = main_module
+
+        server = module.mcp
+
+        assert module.mcp is server
+        mock_register.assert_called_once_with(server)
+
+    def test_unknown_attribute(self, main_module):
+        """Test that other missing attributes still raise AttributeError."""
+        module, _ = main_module
+
+        with pytest.raises(AttributeError):
+            module.not_a_server
@@ -13,11 +13,16 @@ Features:
 - Integration with flake8 for additional linting
 """
 
-import subprocess
+import sys
 
 from mcp_suite.servers.qa import logger
 from mcp_suite.servers.qa.utils.decorators import exception_handler
 from mcp_suite.servers.qa.utils.git_utils import get_git_root
+from mcp_suite.servers.qa.utils.process_utils import run_command
+
+# autoflake is a dependency of the server, so it runs from the server's own
+# interpreter. That skips uv's environment resolution and any PATH shims
+_AUTOFLAKE_CMD = [sys.executable, "-m", "autoflake"]
 
 
 @exception_handler()
@@ -36,17 +41,15 @@ async def run_autoflake(file_path: str = ".", fix: bool = True):
     Returns:
         dict: A dictionary containing analysis results and instructions
     """
-    logger.info(f"Running autoflake on {file_path} with fix={fix}")
+    logger.info("Running autoflake on {} with fix={}", file_path, fix)
 
     # Find git root directory
     git_root = get_git_root()
-    logger.debug(f"Git root directory: {git_root}")
+    logger.debug("Git root directory: {}", git_root)
 
     # Prepare the command
     cmd = [
-        "uv",
-        "run",
-        "autoflake",
+        *_AUTOFLAKE_CMD,
         "--recursive",
         "--remove-all-unused-imports",
         "--remove-unused-variables",
@@ -67,9 +70,9 @@ async def run_autoflake(file_path: str = ".", fix: bool = True):
     cmd.append(file_path)
 
     # Run the command
-    logger.info(f"Executing command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=str(git_root), text=True, capture_output=True)
-    logger.debug(f"Command exit code: {result.returncode}")
+    logger.opt(lazy=True).info("Executing command: {}", lambda: " ".join(cmd))
+    result = await run_command(cmd, cwd=git_root)
+    logger.debug("Command exit code: {}", result.returncode)
 
     # Process the results
     if result.returncode == 0:
@@ -83,8 +86,8 @@ async def run_autoflake(file_path: str = ".", fix: bool = True):
             ),
         }
     else:
-        logger.error(f"Autoflake analysis failed with exit code {result.returncode}")
-        logger.error(f"Error: {result.stderr}")
+        logger.error("Autoflake analysis failed with exit code {}", result.returncode)
+        logger.error("Error: {}", result.stderr)
         return {
             "Status": "Error",
             "Message": f"Autoflake analysis failed with exit code {result.returncode}",
@@ -13,9 +13,10 @@ Features:
 """
 
 from mcp_suite.servers.qa import logger
+from mcp_suite.servers.qa.config import ReportPaths
 from mcp_suite.servers.qa.service.coverage import process_coverage_json
 from mcp_suite.servers.qa.utils.decorators import exception_handler
-from mcp_suite.servers.qa.utils.git_utils import get_git_root
+from mcp_suite.servers.qa.utils.git_utils import get_report_path
 
 
 @exception_handler()
@@ -33,18 +34,14 @@ async def run_coverage(file_path):
     Returns:
         dict: A dictionary containing coverage results and instructions
     """
-    logger.info(f"Analyzing code coverage for {file_path}")
-
-    # Find git root directory
-    git_root = get_git_root()
-    logger.debug(f"Git root directory: {git_root}")
+    logger.info("Analyzing code coverage for {}", file_path)
 
     # Process coverage data
-    coverage_file = git_root / "reports" / "coverage.json"
-    logger.debug(f"Coverage file: {coverage_file}")
+    coverage_file = get_report_path(ReportPaths.COVERAGE)
+    logger.debug("Coverage file: {}", coverage_file)
 
     logger.info("Processing coverage data")
-    coverage_issues = process_coverage_json(str(coverage_file), file_path)
+    coverage_issues = process_coverage_json(coverage_file, file_path)
 
     # If no issues found, return success
     if not coverage_issues:
@@ -58,8 +55,8 @@ async def run_coverage(file_path):
         }
 
     # Return the first issue to fix
-    logger.warning(f"Found {len(coverage_issues)} coverage issues")
-    logger.debug(f"First issue: {coverage_issues[0]}")
+    logger.warning("Found {} coverage issues", len(coverage_issues))
+    logger.debug("First issue: {}", coverage_issues[0])
 
     return {
         "Status": "Issues Found",
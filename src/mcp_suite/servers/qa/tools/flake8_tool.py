@@ -8,16 +8,162 @@ quality checks.
 Features:
 - Check code style and quality using flake8
 - Generate JSON reports of issues
+- Reuse the results of files that have not changed since the last run
 - Provide helpful instructions for fixing issues
 - Integration with the existing autoflake processing
 """
 
-import subprocess
+import fnmatch
+import json
+import os
+import sys
+import tempfile
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import orjson
 
 from mcp_suite.servers.qa import logger
+from mcp_suite.servers.qa.config import ReportPaths
 from mcp_suite.servers.qa.service.flake8 import process_flake8_results
 from mcp_suite.servers.qa.utils.decorators import exception_handler
 from mcp_suite.servers.qa.utils.git_utils import get_git_root
+from mcp_suite.servers.qa.utils.json_utils import load_json_file, write_file_atomic
+from mcp_suite.servers.qa.utils.lint_cache import file_digest, load_cache, save_cache
+from mcp_suite.servers.qa.utils.process_utils import run_command
+
+# flake8 is a dependency of the server, so it runs from the server's own
+# interpreter. That skips uv's environment resolution and any PATH shims
+_FLAKE8_CMD = [sys.executable, "-m", "flake8"]
+
+try:
+    _FLAKE8_VERSION = metadata.version("flake8")
+except metadata.PackageNotFoundError:
+    _FLAKE8_VERSION = ""
+
+# flake8's own default --exclude, which an explicit --exclude replaces, plus
+# virtual environments and cookiecutter templates
+_EXCLUDE = (
+    ".svn",
+    "CVS",
+    ".bzr",
+    ".hg",
+    ".git",
+    "__pycache__",
+    ".tox",
+    ".nox",
+    ".eggs",
+    "*.egg",
+    ".venv",
+    "venv",
+    "*cookiecutter*",
+)
+
+# Files in the git root flake8 may read its configuration from
+_CONFIG_FILES = ("setup.cfg", "tox.ini", ".flake8", "pyproject.toml")
+
+# Most changed files passed to flake8 by name before it walks the target
+_MAX_FILE_ARGS = 500
+
+
+def _collect_files(git_root: Path, file_path: str) -> Optional[List[str]]:
+    """
+    List the Python files flake8 would check for file_path.
+
+    Args:
+        git_root: The git root directory flake8 runs in
+        file_path: The file or directory to analyze (relative to git root)
+
+    Returns:
+        The files as normalized paths relative to the git root, or None if
+        file_path does not exist and is left to flake8 to report
+    """
+    target = git_root / file_path
+    if target.is_file():
+        return [os.path.normpath(file_path)]
+    if not target.is_dir():
+        return None
+
+    files = []
+    for dirpath, dirnames, filenames in os.walk(target):
+        dirnames[:] = sorted(d for d in dirnames if not _is_excluded(d))
+        rel_dir = os.path.relpath(dirpath, git_root)
+        files.extend(
+            os.path.normpath(os.path.join(rel_dir, name))
+            for name in sorted(filenames)
+            if name.endswith(".py") and not _is_excluded(name)
+        )
+    return files
+
+
+def _is_excluded(name: str) -> bool:
+    """Return whether a file or directory name matches an _EXCLUDE pattern."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in _EXCLUDE)
+
+
+def _config_digests(git_root: Path) -> Dict[str, str]:
+    """Return the digest of every flake8 configuration file in the git root."""
+    return {
+        name: file_digest(git_root / name)
+        for name in _CONFIG_FILES
+        if (git_root / name).is_file()
+    }
+
+
+def _prune_cache(
+    cache: Dict[str, Dict[str, Any]], file_path: str, files: List[str]
+) -> bool:
+    """
+    Drop the cache entries of files under file_path that no longer exist.
+
+    Entries outside file_path belong to other targets and are kept.
+
+    Args:
+        cache: Cached entries by normalized file name, updated in place
+        file_path: The file or directory that was walked
+        files: The files found under file_path
+
+    Returns:
+        True if any entry was dropped
+    """
+    target = os.path.normpath(file_path)
+    seen = set(files)
+    stale = [
+        name
+        for name in cache
+        if name not in seen
+        and (target == "." or name == target or name.startswith(target + os.sep))
+    ]
+    for name in stale:
+        del cache[name]
+    return bool(stale)
+
+
+def _partition_files(
+    git_root: Path, files: List[str], cache: Mapping[str, Dict[str, Any]]
+) -> Tuple[Dict[str, List[Any]], Dict[str, str]]:
+    """
+    Split files into those with cached results and those flake8 must check.
+
+    Args:
+        git_root: The git root directory the file names are relative to
+        files: The files to analyze
+        cache: Cached {"digest": ..., "issues": [...]} entries by file name
+
+    Returns:
+        The cached issues of unchanged files, and the current digest of every
+        file that is new or has changed
+    """
+    cached, changed = {}, {}
+    for name in files:
+        digest = file_digest(git_root / name)
+        entry = cache.get(name)
+        if entry and entry.get("digest") == digest:
+            cached[name] = entry["issues"]
+        else:
+            changed[name] = digest
+    return cached, changed
 
 
 @exception_handler()
@@ -40,64 +186,121 @@ async def run_flake8(
         dict: A dictionary containing analysis results and instructions
     """
     logger.info(
-        f"Running flake8 on {file_path} with "
-        f"max_line_length={max_line_length}, ignore={ignore}"
+        "Running flake8 on {} with max_line_length={}, ignore={}",
+        file_path,
+        max_line_length,
+        ignore,
     )
 
     # Find git root directory
     git_root = get_git_root()
-    logger.debug(f"Git root directory: {git_root}")
+    logger.debug("Git root directory: {}", git_root)
 
     # Ensure reports directory exists
-    reports_dir = git_root / "reports"
+    cache_file = git_root / ReportPaths.LINT_CACHE.path
+    reports_dir = cache_file.parent
     reports_dir.mkdir(exist_ok=True)
-    logger.debug(f"Reports directory: {reports_dir}")
+    logger.debug("Reports directory: {}", reports_dir)
 
     # Define the output file path
     output_file = git_root / "flake8.json"
-    logger.debug(f"Output file: {output_file}")
-
-    # Delete any existing flake8.json file to prevent appending issues
-    if output_file.exists():
-        logger.debug("Removing existing flake8.json file")
-        output_file.unlink()
-
-    # Prepare the command
-    cmd = [
-        "uv",
-        "run",
-        "flake8",
-        "--format=json",
-        f"--output-file={output_file}",
-        f"--max-line-length={max_line_length}",
-        f"--ignore={ignore}",
-        "--exclude=*cookiecutter*",
-    ]
+    logger.debug("Output file: {}", output_file)
+
+    # Files whose contents match a cached digest reuse their previous results,
+    # so flake8 only checks what changed. The cache is dropped whenever the
+    # flake8 version, the options or a configuration file change
+    meta = {
+        "flake8": _FLAKE8_VERSION,
+        "max_line_length": max_line_length,
+        "ignore": ignore,
+        "config": _config_digests(git_root),
+    }
+    files = _collect_files(git_root, file_path)
+    cache = load_cache(cache_file, meta) if files is not None else {}
+    pruned = files is not None and _prune_cache(cache, file_path, files)
+    cached, changed = _partition_files(git_root, files or [], cache)
+
+    if files is not None and not changed:
+        logger.info("All {} files unchanged, reusing cached results", len(files))
+        if pruned:
+            save_cache(cache_file, meta, cache)
+        write_file_atomic(output_file, orjson.dumps(cached))
+        return process_flake8_results(output_file)
+
+    # flake8 writes to a private temporary file, which only replaces the
+    # report once flake8 has exited. A crashed run cannot leave a truncated
+    # report behind, and concurrent runs never share an output file
+    fd, raw_name = tempfile.mkstemp(dir=git_root, prefix="flake8.", suffix=".tmp")
+    os.close(fd)
+    raw_file = Path(raw_name)
+
+    try:
+        # Prepare the command
+        cmd = [
+            *_FLAKE8_CMD,
+            "--format=json",
+            f"--output-file={raw_file}",
+            f"--max-line-length={max_line_length}",
+            f"--ignore={ignore}",
+            f"--exclude={','.join(_EXCLUDE)}",
+            # flake8 checks files independently, so let it spread them over all
+            # cores instead of walking the tree in a single process
+            "--jobs=auto",
+        ]
+
+        # Add the files to check. When the target could not be listed, or
+        # naming every changed file would make an overly long command line,
+        # flake8 is given the target itself and walks it
+        if files is not None and len(changed) <= _MAX_FILE_ARGS:
+            cmd.extend(changed)
+            logger.debug(
+                "Checking {} of {} files in {}", len(changed), len(files), file_path
+            )
+        else:
+            cmd.append(file_path)
+            logger.debug("Using specified file path: {}", file_path)
+
+        # Run the command
+        logger.opt(lazy=True).info("Executing command: {}", lambda: " ".join(cmd))
+        result = await run_command(cmd, cwd=git_root)
+        logger.debug("Command exit code: {}", result.returncode)
+
+        # Check if flake8 ran successfully
+        if result.returncode != 0 and "No such file or directory" in result.stderr:
+            logger.error("Flake8 failed with error: {}", result.stderr)
+            return {
+                "Status": "Error",
+                "Message": f"Flake8 failed with error: {result.stderr}",
+                "Instructions": (
+                    "There was an error running flake8. Please check if flake8 "
+                    "is installed correctly and that the file path is valid."
+                ),
+            }
+
+        if files is None:
+            os.replace(raw_file, output_file)
+        else:
+            try:
+                fresh = load_json_file(raw_file)
+            except (OSError, json.JSONDecodeError):
+                # Without a usable report there is nothing to cache or merge,
+                # and the previous report is left as it was
+                return process_flake8_results(raw_file)
+
+            # flake8 echoes the names it was given, normalized here to be safe
+            fresh = {os.path.normpath(name): issues for name, issues in fresh.items()}
+            for name, digest in changed.items():
+                issues = fresh.get(name, [])
+                cached[name] = issues
+                cache[name] = {"digest": digest, "issues": issues}
+            save_cache(cache_file, meta, cache)
 
-    # Add the target file or directory
-    if file_path != ".":
-        cmd.append(file_path)
-        logger.debug(f"Using specified file path: {file_path}")
-    else:
-        cmd.append(".")
-        logger.debug("Using current directory")
-
-    # Run the command
-    logger.info(f"Executing command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=str(git_root), text=True, capture_output=True)
-    logger.debug(f"Command exit code: {result.returncode}")
-
-    # Check if flake8 ran successfully
-    if result.returncode != 0 and "No such file or directory" in result.stderr:
-        logger.error(f"Flake8 failed with error: {result.stderr}")
-        return {
-            "Status": "Error",
-            "Message": f"Flake8 failed with error: {result.stderr}",
-            "Instructions": (
-                "There was an error running flake8. Please check if flake8 "
-                "is installed correctly and that the file path is valid."
-            ),
-        }
+            # Report every file in walk order, cached or freshly checked
+            write_file_atomic(
+                output_file, orjson.dumps({name: cached[name] for name in files})
+            )
+    finally:
+        raw_file.unlink(missing_ok=True)
 
     # Process the results using the existing autoflake processing
     logger.info("Processing flake8 results")
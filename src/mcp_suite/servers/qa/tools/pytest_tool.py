@@ -11,16 +11,85 @@ Features:
 - Generate coverage reports
 - Analyze test failures and collection errors
 - Provide helpful instructions for fixing issues
+- Spread directory runs across cores with pytest-xdist when the project
+  has it installed
+
+Directory runs use xdist's loadgroup distribution, so tests that share a
+contended resource (a database, a port, a fixed file) can be pinned to one
+worker by marking them with the same group:
+
+    @pytest.mark.xdist_group("redis")
+    def test_uses_redis(): ...
 """
 
-import subprocess
-import time
+import os
 from pathlib import Path
+from typing import List, Set
 
 from mcp_suite.servers.qa import logger
+from mcp_suite.servers.qa.config import ReportPaths
 from mcp_suite.servers.qa.service.pytest import process_pytest_results
 from mcp_suite.servers.qa.utils.decorators import exception_handler
-from mcp_suite.servers.qa.utils.git_utils import get_git_root
+from mcp_suite.servers.qa.utils.git_utils import get_git_root, get_report_path
+from mcp_suite.servers.qa.utils.process_utils import run_command
+
+# Git roots whose `uv run` environment has pytest-xdist. That is the
+# project's environment, not the server's, so it is probed with a subprocess
+# instead of with find_spec. Only successful probes are cached, so a failed
+# probe or a later install of pytest-xdist is picked up on the next run
+_XDIST_ROOTS: Set[Path] = set()
+
+
+async def _has_xdist(git_root: Path) -> bool:
+    """
+    Check whether pytest-xdist can be imported in the project's environment.
+
+    Args:
+        git_root: The git root directory pytest runs in
+
+    Returns:
+        True if `uv run python -c "import xdist"` succeeds in git_root
+    """
+    if git_root in _XDIST_ROOTS:
+        return True
+
+    result = await run_command(
+        ["uv", "run", "python", "-c", "import xdist"], cwd=git_root
+    )
+    if result.returncode != 0:
+        logger.debug("pytest-xdist not available: {}", result.stderr.strip())
+        return False
+
+    _XDIST_ROOTS.add(git_root)
+    logger.debug("pytest-xdist available")
+    return True
+
+
+def _xdist_args(git_root: Path, file_path: str, has_xdist: bool) -> List[str]:
+    """
+    Build the pytest-xdist arguments for a run.
+
+    Directories are split across all but two cores, leaving room for the
+    server and the coverage collector. Single files run in one process,
+    overriding any -n from the project's addopts, since starting workers
+    costs more than a single file's tests save.
+
+    Args:
+        git_root: The git root directory pytest runs in
+        file_path: The file or directory to test, or "." for all tests
+        has_xdist: Whether pytest-xdist is installed in the project
+
+    Returns:
+        The arguments to add to the pytest command, empty without xdist
+    """
+    if not has_xdist:
+        return []
+
+    if file_path == "." or (git_root / file_path).is_dir():
+        workers = max(1, (os.cpu_count() or 1) - 2)
+        return ["-n", str(workers), "--dist", "loadgroup"]
+
+    return ["-n", "0"]
 
 
 @exception_handler()
@@ -29,6 +98,8 @@ async def run_pytest(file_path: str):
     Run pytest tests using subprocess in the git parent directory.
 
     This function finds the git root directory and runs pytest from there.
+    The test run is awaited, so the server can handle other tool calls while
+    it is in progress.
     It generates JSON reports for test results and coverage, and analyzes
     the results to provide helpful feedback.
 
@@ -40,11 +111,11 @@ async def run_pytest(file_path: str):
     Returns:
         dict: A dictionary containing test results and instructions
     """
-    logger.info(f"Running pytest on {file_path}")
+    logger.info("Running pytest on {}", file_path)
 
     # Find git root directory
     git_root = get_git_root()
-    logger.debug(f"Git root directory: {git_root}")
+    logger.debug("Git root directory: {}", git_root)
 
     # Change to git root directory and run pytest
     cmd = [
@@ -56,10 +127,11 @@ async def run_pytest(file_path: str):
     ]
     if file_path != ".":
         cmd.append(file_path)
-        logger.debug(f"Using specified file path: {file_path}")
+        logger.debug("Using specified file path: {}", file_path)
     else:
         logger.debug("Running tests on all files")
 
+    cmd.extend(_xdist_args(git_root, file_path, await _has_xdist(git_root)))
     cmd.extend(
         [
             "--json-report",
@@ -69,16 +141,14 @@ async def run_pytest(file_path: str):
         ]
     )
 
-    logger.info(f"Executing command: {' '.join(cmd)}")
-    result = subprocess.run(cmd, cwd=str(git_root), text=True, capture_output=True)
-    logger.debug(f"Command exit code: {result.returncode}")
+    logger.opt(lazy=True).info("Executing command: {}", lambda: " ".join(cmd))
+    result = await run_command(cmd, cwd=git_root)
+    logger.debug("Command exit code: {}", result.returncode)
 
     # Check if pytest command failed to execute properly
-    if (
-        result.returncode != 0
-        and not Path(git_root / "reports" / "pytest_results.json").exists()
-    ):
-        logger.error(f"Pytest failed with error: {result.stderr}")
+    results_file = get_report_path(ReportPaths.PYTEST_RESULTS)
+    if result.returncode != 0 and not results_file.exists():
+        logger.error("Pytest failed with error: {}", result.stderr)
         return {
             "Status": "Error",
             "Message": f"Pytest failed with error: {result.stderr}",
@@ -88,21 +158,20 @@ async def run_pytest(file_path: str):
             ),
         }
 
-    logger.debug("Waiting for file system to sync...")
-    time.sleep(1)
-
     # Process the results to get both collection errors and test failures
     logger.info("Processing pytest results")
-    processed_results = process_pytest_results("./reports/pytest_results.json")
+    processed_results = process_pytest_results(
+        results_file, get_report_path(ReportPaths.FAILED_TESTS)
+    )
 
     # Check for collection errors first
     if processed_results.failed_collections:
         # Return the first collection error to fix
-        error = processed_results.failed_collections[0]
-        logger.warning(f"Collection error found: {error.model_dump()}")
+        error = processed_results.failed_collections[0].model_dump()
+        logger.warning("Collection error found: {}", error)
 
         return {
-            "Failed Collection": error.model_dump(),
+            "Failed Collection": error,
             "Instructions": (
                 "Don't worry, we've got this! Let's fix this collection error first "
                 "before running tests. This is typically an import error or "
@@ -113,11 +182,11 @@ async def run_pytest(file_path: str):
 
     # If no collection errors, check for test failures
     if processed_results.failed_tests:
-        failure = processed_results.failed_tests[0]
-        logger.warning(f"Test failure found: {failure.model_dump()}")
+        failure = processed_results.failed_tests[0].model_dump()
+        logger.warning("Test failure found: {}", failure)
 
         return {
-            "Failed Tests": failure.model_dump(),
+            "Failed Tests": failure,
             "Instructions": (
                 "You're making great progress! Let's tackle this test failure together. "
                 "I'll explain what's happening and suggest how to fix it. "
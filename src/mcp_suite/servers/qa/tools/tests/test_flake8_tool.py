@@ -1,18 +1,44 @@
 """Tests for the flake8 tool."""
 
-from unittest.mock import MagicMock, patch
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import orjson
 import pytest
 
 from mcp_suite.servers.qa.tools.flake8_tool import run_flake8
 
+E225 = {
+    "code": "E225",
+    "line_number": 1,
+    "column_number": 2,
+    "text": "missing whitespace around operator",
+    "physical_line": "x=1\n",
+}
+
+
+def _fake_flake8(issues_by_file):
+    """Build a run_command mock that writes a flake8 report for its files."""
+
+    async def run(cmd, cwd):
+        output = next(arg for arg in cmd if arg.startswith("--output-file="))
+        first_file = cmd.index("--jobs=auto") + 1
+        names = cmd[first_file:]
+        report = {name: issues_by_file.get(name, []) for name in names}
+        Path(output.split("=", 1)[1]).write_bytes(orjson.dumps(report))
+        return subprocess.CompletedProcess(cmd, int(any(report.values())), "", "")
+
+    return AsyncMock(side_effect=run)
+
 
 class TestFlake8Tool:
     """Test cases for the flake8 tool."""
 
     @pytest.mark.asyncio
     @patch("mcp_suite.servers.qa.tools.flake8_tool.process_flake8_results")
-    @patch("subprocess.run")
+    @patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", new_callable=AsyncMock)
     @patch("mcp_suite.servers.qa.tools.flake8_tool.get_git_root")
     @patch("pathlib.Path.mkdir")
     @patch("pathlib.Path.exists")
@@ -25,11 +51,11 @@ class TestFlake8Tool:
         mock_get_git_root,
         mock_run,
         mock_process_results,
+        tmp_path,
     ):
         """Test successful execution of flake8."""
         # Setup mocks
-        mock_git_root = MagicMock()
-        mock_get_git_root.return_value = mock_git_root
+        mock_get_git_root.return_value = tmp_path
         mock_exists.return_value = True
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -46,9 +72,16 @@ class TestFlake8Tool:
         # Verify the result matches what the mock returns
         assert result == expected_result
 
+        # Verify flake8 runs from the server's interpreter and is asked to
+        # check files in parallel
+        cmd = mock_run.call_args.args[0]
+        assert cmd[:3] == [sys.executable, "-m", "flake8"]
+        assert "--jobs=auto" in cmd
+        assert cmd[-1] == "test_path"
+
     @pytest.mark.asyncio
     @patch("mcp_suite.servers.qa.tools.flake8_tool.process_flake8_results")
-    @patch("subprocess.run")
+    @patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", new_callable=AsyncMock)
     @patch("mcp_suite.servers.qa.tools.flake8_tool.get_git_root")
     @patch("pathlib.Path.mkdir")
     @patch("pathlib.Path.exists")
@@ -61,11 +94,12 @@ class TestFlake8Tool:
         mock_get_git_root,
         mock_run,
         mock_process_results,
+        tmp_path,
     ):
         """Test flake8 execution with default path (.)."""
         # Setup mocks
-        mock_git_root = MagicMock()
-        mock_get_git_root.return_value = mock_git_root
+        (tmp_path / "module.py").write_text("X = 1\n")
+        mock_get_git_root.return_value = tmp_path
         mock_exists.return_value = True
         mock_run.return_value = MagicMock(returncode=0)
 
@@ -82,18 +116,27 @@ class TestFlake8Tool:
         # Verify the result matches what the mock returns
         assert result == expected_result
 
+        # Verify the files under the directory are passed to flake8
+        assert mock_run.call_args.args[0][-1] == "module.py"
+
     @pytest.mark.asyncio
-    @patch("subprocess.run")
+    @patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", new_callable=AsyncMock)
     @patch("mcp_suite.servers.qa.tools.flake8_tool.get_git_root")
     @patch("pathlib.Path.mkdir")
     @patch("pathlib.Path.exists")
     @patch("pathlib.Path.unlink")
     async def test_run_flake8_error(
-        self, mock_unlink, mock_exists, mock_mkdir, mock_get_git_root, mock_run
+        self,
+        mock_unlink,
+        mock_exists,
+        mock_mkdir,
+        mock_get_git_root,
+        mock_run,
+        tmp_path,
     ):
         """Test flake8 execution with an error."""
         # Setup mocks
-        mock_get_git_root.return_value = MagicMock()
+        mock_get_git_root.return_value = tmp_path
         mock_exists.return_value = True
         mock_run.return_value = MagicMock(
             returncode=1, stderr="No such file or directory"
@@ -106,3 +149,138 @@ class TestFlake8Tool:
         assert result["Status"] == "Error"
         assert "Message" in result
         assert "Instructions" in result
+
+
+class TestFlake8Cache:
+    """Test cases for reusing the results of unchanged files."""
+
+    @pytest.fixture
+    def git_root(self, tmp_path):
+        """A git root with a clean file, a file with an issue and excluded dirs."""
+        src = tmp_path / "src"
+        for excluded in ("cookiecutter_template", ".venv", "__pycache__", ".git"):
+            (src / excluded).mkdir(parents=True)
+            (src / excluded / "skipped.py").write_text("x=1\n")
+        (src / "clean.py").write_text("X = 1\n")
+        (src / "messy.py").write_text("x=1\n")
+        with patch(
+            "mcp_suite.servers.qa.tools.flake8_tool.get_git_root",
+            return_value=tmp_path,
+        ):
+            yield tmp_path
+
+    @pytest.mark.asyncio
+    async def test_unchanged_files_are_not_rechecked(self, git_root):
+        """Test that only new or modified files are passed to flake8."""
+        fake = _fake_flake8({"src/messy.py": [E225]})
+        with patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", fake):
+            first = await run_flake8("src/")
+            second = await run_flake8("src/")
+            (git_root / "src" / "clean.py").write_text("Y = 2\n")
+            third = await run_flake8("src/")
+
+        assert first["Status"] == second["Status"] == third["Status"]
+        assert first["Issue"] == second["Issue"] == third["Issue"] == E225
+
+        # The excluded directories are never walked, and the second run is
+        # answered entirely from the cache
+        assert fake.await_count == 2
+        first_cmd, third_cmd = (call.args[0] for call in fake.await_args_list)
+        first_file = first_cmd.index("--jobs=auto") + 1
+        assert first_cmd[first_file:] == ["src/clean.py", "src/messy.py"]
+        assert third_cmd[-1] == "src/clean.py"
+
+        # The merged report still lists every file
+        report = orjson.loads((git_root / "flake8.json").read_bytes())
+        assert report == {"src/clean.py": [], "src/messy.py": [E225]}
+
+    @pytest.mark.asyncio
+    async def test_changed_options_invalidate_cache(self, git_root):
+        """Test that different flake8 options re-check every file."""
+        fake = _fake_flake8({"src/messy.py": [E225]})
+        with patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", fake):
+            await run_flake8("src/")
+            await run_flake8("src/", max_line_length=100)
+
+        assert fake.await_count == 2
+        assert fake.await_args.args[0][-2:] == ["src/clean.py", "src/messy.py"]
+
+    @pytest.mark.asyncio
+    async def test_crashed_run_keeps_previous_report(self, git_root):
+        """Test that a flake8 run without a report changes nothing on disk."""
+        previous = git_root / "flake8.json"
+        previous.write_bytes(b"{}")
+        failing = AsyncMock(
+            return_value=subprocess.CompletedProcess([], 1, "", "crashed")
+        )
+        with patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", failing):
+            result = await run_flake8("src/")
+
+        assert result["Status"] == "Error"
+        assert previous.read_bytes() == b"{}"
+        assert not (git_root / "reports" / ".lint-cache.json").exists()
+        assert not list(git_root.glob("flake8.*.tmp"))
+
+    @pytest.mark.asyncio
+    async def test_many_changed_files_pass_target(self, git_root):
+        """Test that flake8 walks the target when too many files changed."""
+        fake = _fake_flake8({})
+
+        async def walk_target(cmd, cwd):
+            assert cmd[-1] == "src/"
+            return await fake([*cmd[:-1], "src/clean.py", "src/messy.py"], cwd)
+
+        with (
+            patch("mcp_suite.servers.qa.tools.flake8_tool._MAX_FILE_ARGS", 1),
+            patch(
+                "mcp_suite.servers.qa.tools.flake8_tool.run_command",
+                AsyncMock(side_effect=walk_target),
+            ) as mock_run,
+        ):
+            result = await run_flake8("src/")
+
+        assert result["Status"] == "Success"
+        mock_run.assert_awaited_once()
+        report = orjson.loads((git_root / "flake8.json").read_bytes())
+        assert report == {"src/clean.py": [], "src/messy.py": []}
+
+    @pytest.mark.asyncio
+    async def test_changed_config_invalidates_cache(self, git_root):
+        """Test that editing a flake8 configuration file re-checks every file."""
+        fake = _fake_flake8({})
+        with patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", fake):
+            await run_flake8("src/")
+            (git_root / "setup.cfg").write_text("[flake8]\nselect = E\n")
+            await run_flake8("src/")
+
+        assert fake.await_count == 2
+        assert fake.await_args.args[0][-2:] == ["src/clean.py", "src/messy.py"]
+
+    @pytest.mark.asyncio
+    async def test_equivalent_paths_share_cache(self, git_root):
+        """Test that differently spelled targets reuse the same entries."""
+        fake = _fake_flake8({"src/messy.py": [E225]})
+        with patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", fake):
+            await run_flake8("src/")
+            result = await run_flake8("./src")
+
+        assert fake.await_count == 1
+        assert result["Issue"] == E225
+        report = orjson.loads((git_root / "flake8.json").read_bytes())
+        assert list(report) == ["src/clean.py", "src/messy.py"]
+
+    @pytest.mark.asyncio
+    async def test_deleted_files_are_dropped_from_cache(self, git_root):
+        """Test that entries of files gone from the target are removed."""
+        (git_root / "other").mkdir()
+        (git_root / "other" / "kept.py").write_text("X = 1\n")
+        fake = _fake_flake8({})
+        with patch("mcp_suite.servers.qa.tools.flake8_tool.run_command", fake):
+            await run_flake8("other/")
+            await run_flake8("src/")
+            (git_root / "src" / "clean.py").unlink()
+            await run_flake8("src/")
+
+        assert fake.await_count == 2
+        cache = orjson.loads((git_root / "reports" / ".lint-cache.json").read_bytes())
+        assert sorted(cache["files"]) == ["other/kept.py", "src/messy.py"]
@@ -0,0 +1,153 @@
+"""Tests for the pytest tool."""
+
+import subprocess
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from mcp_suite.servers.qa.models.pytest_models import PytestResults, PytestSummary
+from mcp_suite.servers.qa.tools import pytest_tool
+from mcp_suite.servers.qa.tools.pytest_tool import _has_xdist, _xdist_args, run_pytest
+
+
+class TestHasXdist:
+    """Test cases for probing the project's environment for pytest-xdist."""
+
+    @pytest.mark.asyncio
+    async def test_success_cached_per_git_root(self, tmp_path):
+        """Test that each git root is probed once with the project's python."""
+        probe = subprocess.CompletedProcess([], 0, "", "")
+        other_root = tmp_path / "other"
+
+        with (
+            patch.object(pytest_tool, "_XDIST_ROOTS", set()),
+            patch.object(
+                pytest_tool, "run_command", AsyncMock(return_value=probe)
+            ) as mock_run,
+        ):
+            assert await _has_xdist(tmp_path) is True
+            assert await _has_xdist(tmp_path) is True
+            assert await _has_xdist(other_root) is True
+
+        assert mock_run.await_count == 2
+        cmd = mock_run.await_args_list[0].args[0]
+        assert cmd == ["uv", "run", "python", "-c", "import xdist"]
+        assert [c.kwargs["cwd"] for c in mock_run.await_args_list] == [
+            tmp_path,
+            other_root,
+        ]
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self, tmp_path):
+        """Test that a failed probe is retried, so a later install is seen."""
+        failed = subprocess.CompletedProcess([], 1, "", "No module named 'xdist'")
+        passed = subprocess.CompletedProcess([], 0, "", "")
+
+        with (
+            patch.object(pytest_tool, "_XDIST_ROOTS", set()),
+            patch.object(
+                pytest_tool, "run_command", AsyncMock(side_effect=[failed, passed])
+            ) as mock_run,
+        ):
+            assert await _has_xdist(tmp_path) is False
+            assert await _has_xdist(tmp_path) is True
+            assert await _has_xdist(tmp_path) is True
+
+        assert mock_run.await_count == 2
+
+
+class TestXdistArgs:
+    """Test cases for choosing pytest-xdist arguments."""
+
+    @pytest.mark.parametrize("cpu_count, workers", [(8, "6"), (2, "1"), (None, "1")])
+    def test_directory_runs_in_parallel(self, tmp_path, cpu_count, workers):
+        """Test that directories are spread over all but two cores."""
+        (tmp_path / "tests").mkdir()
+
+        with patch("os.cpu_count", return_value=cpu_count):
+            args = _xdist_args(tmp_path, "tests", True)
+
+        assert args == ["-n", workers, "--dist", "loadgroup"]
+
+    def test_whole_project_runs_in_parallel(self, tmp_path):
+        """Test that "." is treated as a directory."""
+        with patch("os.cpu_count", return_value=4):
+            assert _xdist_args(tmp_path, ".", True) == [
+                "-n",
+                "2",
+                "--dist",
+                "loadgroup",
+            ]
+
+    def test_single_file_runs_serially(self, tmp_path):
+        """Test that a single test file disables xdist."""
+        (tmp_path / "test_module.py").write_text("")
+
+        assert _xdist_args(tmp_path, "test_module.py", True) == ["-n", "0"]
+
+    def test_without_xdist(self, tmp_path):
+        """Test that no arguments are added when xdist is not installed."""
+        assert _xdist_args(tmp_path, ".", False) == []
+
+
+class TestRunPytest:
+    """Test cases for the run_pytest tool."""
+
+    @pytest.mark.asyncio
+    async def test_results_processed_after_run(self, tmp_path):
+        """Test that results are processed as soon as pytest exits."""
+        passed = PytestResults(summary=PytestSummary(total=1, passed=1, collected=1))
+
+        with (
+            patch.object(pytest_tool, "get_git_root", return_value=tmp_path),
+            patch.object(
+                pytest_tool,
+                "get_report_path",
+                side_effect=lambda report: tmp_path / report.path,
+            ),
+            patch.object(
+                pytest_tool,
+                "run_command",
+                AsyncMock(return_value=subprocess.CompletedProcess([], 0, "", "")),
+            ) as mock_run,
+            patch.object(
+                pytest_tool, "process_pytest_results", return_value=passed
+            ) as mock_process,
+            patch("time.sleep") as mock_sleep,
+        ):
+            result = await run_pytest("tests/test_module.py")
+
+        assert result["Status"] == "Success"
+        assert result["Summary"] == passed.summary.model_dump()
+        mock_process.assert_called_once_with(
+            tmp_path / "reports/pytest_results.json",
+            tmp_path / "reports/failed_tests.json",
+        )
+        mock_sleep.assert_not_called()
+
+        # The xdist probe succeeded, so the single file is run serially
+        probe, run = (call.args[0] for call in mock_run.await_args_list)
+        assert probe[-1] == "import xdist"
+        assert run[run.index("-n") + 1] == "0"
+
+    @pytest.mark.asyncio
+    async def test_run_without_results(self, tmp_path):
+        """Test that a failed run that wrote no results reports an error."""
+        failed = subprocess.CompletedProcess([], 4, "", "usage: pytest")
+
+        with (
+            patch.object(pytest_tool, "get_git_root", return_value=tmp_path),
+            patch.object(
+                pytest_tool,
+                "get_report_path",
+                side_effect=lambda report: tmp_path / report.path,
+            ),
+            patch.object(
+                pytest_tool, "run_command", AsyncMock(return_value=failed)
+            ) as mock_run,
+        ):
+            result = await run_pytest("tests/test_missing.py")
+
+        assert result["Status"] == "Error"
+        assert "usage: pytest" in result["Message"]
+        assert mock_run.await_args.kwargs["cwd"] == tmp_path
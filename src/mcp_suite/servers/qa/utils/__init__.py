@@ -1,7 +1,18 @@
 """Utility functions for the pytest server."""
 
 from .decorators import exception_handler
-from .git_utils import get_git_root
+from .git_utils import get_git_root, get_report_path
+from .json_utils import get_file_size, load_json_file, write_file_atomic
 from .module_utils import get_reinitalized_mcp
+from .process_utils import run_command
 
-__all__ = ["get_git_root", "exception_handler", "get_reinitalized_mcp"]
+__all__ = [
+    "get_git_root",
+    "get_report_path",
+    "exception_handler",
+    "get_reinitalized_mcp",
+    "get_file_size",
+    "load_json_file",
+    "write_file_atomic",
+    "run_command",
+]
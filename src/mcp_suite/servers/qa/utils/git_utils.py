@@ -1,17 +1,24 @@
 """Git utility functions for the pytest server."""
 
+import functools
 from pathlib import Path
 
 from mcp_suite.servers.qa import logger
+from mcp_suite.servers.qa.config import ReportPaths
 
 # Bind the component field to the logger
 logger = logger.bind(component="git_utils")
 
 
+@functools.lru_cache(maxsize=None)
 def get_git_root():
     """
     Find the git root directory by traversing up from the current file.
 
+    The search starts from this module's location, which cannot change while
+    the server runs, so the result is computed once per process. A failed
+    search raises and is not cached.
+
     Returns:
         Path: The path to the git root directory.
 
@@ -37,3 +44,22 @@ def get_git_root():
         raise FileNotFoundError(error_msg)
 
     return git_root
+
+
+@functools.lru_cache(maxsize=None)
+def get_report_path(report: ReportPaths) -> Path:
+    """
+    Return the absolute path of a report under the git root.
+
+    Like the git root itself, each report path is built once per process.
+
+    Args:
+        report: The report to locate
+
+    Returns:
+        Path: The report's path inside the git root directory.
+
+    Raises:
+        FileNotFoundError: If the git root directory cannot be found.
+    """
+    return get_git_root() / report.path
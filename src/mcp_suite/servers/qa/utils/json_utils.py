@@ -0,0 +1,120 @@
+"""JSON utility functions for the SaagaLint MCP server."""
+
+import contextlib
+import mmap
+import os
+import stat
+import tempfile
+from typing import Any, Iterable, Optional, Tuple, Union
+
+import orjson
+
+# Files at least this large are memory-mapped instead of read into memory
+MMAP_THRESHOLD = 1 << 20
+
+# Mode open(path, "w") would give a new file. mkstemp creates files as 0600,
+# so atomic writes apply this instead. The umask can only be read by setting
+# it, which is done once here rather than on every write
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_NEW_FILE_MODE = 0o666 & ~_UMASK
+
+
+def get_file_size(path: Union[str, os.PathLike]) -> int:
+    """Return the size of a file in bytes, or 0 if it cannot be determined."""
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def load_json_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Load a JSON document from a file using orjson.
+
+    Small files are read in a single call. Files of at least MMAP_THRESHOLD
+    bytes are memory-mapped, so the parser reads straight from the page cache
+    without first copying the whole file into a bytes object.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        The decoded JSON document
+
+    Raises:
+        FileNotFoundError: If the file doesn't exist
+        json.JSONDecodeError: If the file isn't valid JSON
+    """
+    with open(path, "rb") as f:
+        if get_file_size(path) < MMAP_THRESHOLD:
+            return orjson.loads(f.read())
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return orjson.loads(view)
+
+
+def write_file_atomic(path: Union[str, os.PathLike], data: bytes) -> None:
+    """
+    Write bytes to a file atomically.
+
+    The data goes to a sibling temporary file that then replaces path with
+    os.replace, so readers never see a partially written report. Each call
+    gets its own uniquely named temporary file, so concurrent writers to the
+    same path cannot truncate each other's data. The file keeps the mode of
+    the file it replaces, and a new file gets the umask's default mode.
+
+    Args:
+        path: Path of the file to write
+        data: Bytes to write
+    """
+    path = os.fspath(path)
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(path) or ".",
+        prefix=f"{os.path.basename(path)}.",
+        suffix=".tmp",
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            os.fchmod(f.fileno(), _file_mode(path))
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
+def _file_mode(path: str) -> int:
+    """Return the permission bits of path, or _NEW_FILE_MODE if it is missing."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return _NEW_FILE_MODE
+
+
+def consume_json_value(
+    events: Iterable[Tuple[str, str, Any]], builder: Optional[Any] = None
+) -> None:
+    """
+    Consume exactly one JSON value from an ijson (prefix, event, value) stream.
+
+    A scalar is a single event; a map or array runs until its matching end
+    event. Every consumed event is fed to builder (an ijson.ObjectBuilder)
+    when one is given, so callers can choose to build or skip each value.
+
+    Args:
+        events: An ijson.parse event iterator positioned before a value
+        builder: Optional object builder to receive the value's events
+    """
+    depth = 0
+    for _, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+        if event in ("start_map", "start_array"):
+            depth += 1
+        elif event in ("end_map", "end_array"):
+            depth -= 1
+        if depth == 0:
+            return
@@ -0,0 +1,66 @@
+"""Lint result cache for the SaagaLint MCP server.
+
+Per-file linter results are stored with the SHA-256 digest of the file they
+were produced from, so files that have not changed since the last run can
+skip the linter. The whole cache is discarded when the linter version or
+options it was built with change.
+"""
+
+import hashlib
+import json
+import os
+from typing import Any, Dict, Mapping, Union
+
+import orjson
+
+from .json_utils import load_json_file, write_file_atomic
+
+
+def file_digest(path: Union[str, os.PathLike]) -> str:
+    """Return the hex SHA-256 digest of a file's contents."""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def load_cache(
+    path: Union[str, os.PathLike], meta: Mapping[str, Any]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the cached per-file results.
+
+    Args:
+        path: Path to the cache file
+        meta: The linter version and options the results must have been
+              produced with
+
+    Returns:
+        A dictionary mapping file paths to {"digest": ..., "issues": [...]}
+        entries, or an empty dictionary if the cache is missing, unreadable,
+        or was built with a different meta
+    """
+    try:
+        data = load_json_file(path)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if not isinstance(data, dict) or data.get("meta") != meta:
+        return {}
+
+    entries = data.get("files")
+    return entries if isinstance(entries, dict) else {}
+
+
+def save_cache(
+    path: Union[str, os.PathLike],
+    meta: Mapping[str, Any],
+    entries: Mapping[str, Dict[str, Any]],
+) -> None:
+    """
+    Write the per-file results to the cache file atomically.
+
+    Args:
+        path: Path to the cache file
+        meta: The linter version and options the results were produced with
+        entries: File paths mapped to {"digest": ..., "issues": [...]} entries
+    """
+    write_file_atomic(path, orjson.dumps({"meta": meta, "files": entries}))
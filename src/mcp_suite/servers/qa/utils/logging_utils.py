@@ -7,6 +7,8 @@ for different components of the SaagaLint system.
 All logging has been disabled as requested.
 """
 
+import functools
+
 from loguru import logger
 
 
@@ -30,11 +32,13 @@ def setup_component_logger(
     return logger.bind(component=component_name)
 
 
+@functools.lru_cache(maxsize=None)
 def get_component_logger(component_name: str) -> logger:
     """
     Get a logger for a specific component.
 
-    This is a no-op function that returns a disabled logger.
+    This is a no-op function that returns a disabled logger. Bound loggers are
+    cached per component, so repeated calls return the same instance.
 
     Args:
         component_name: The name of the component
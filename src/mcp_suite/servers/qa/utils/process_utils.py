@@ -0,0 +1,38 @@
+"""Subprocess utility functions for the SaagaLint MCP server."""
+
+import asyncio
+import os
+import subprocess
+from typing import Sequence, Union
+
+
+async def run_command(
+    cmd: Sequence[str], cwd: Union[str, os.PathLike]
+) -> subprocess.CompletedProcess:
+    """
+    Run a command and capture its output without blocking the event loop.
+
+    This is the asyncio counterpart of
+    subprocess.run(cmd, cwd=cwd, text=True, capture_output=True), so tools
+    can await a linter while the MCP server keeps serving other requests.
+
+    Args:
+        cmd: The program and its arguments
+        cwd: Directory to run the command in
+
+    Returns:
+        A CompletedProcess with the exit code and the decoded stdout and stderr
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    stdout, stderr = await proc.communicate()
+    return subprocess.CompletedProcess(
+        list(cmd),
+        proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
@@ -5,12 +5,22 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from mcp_suite.servers.qa.utils.git_utils import get_git_root
+from mcp_suite.servers.qa.config import ReportPaths
+from mcp_suite.servers.qa.utils.git_utils import get_git_root, get_report_path
 
 
 class TestGitUtils:
     """Tests for git utility functions."""
 
+    @pytest.fixture(autouse=True)
+    def clear_git_root_cache(self):
+        """Make each test search for the git root instead of reusing a result."""
+        get_git_root.cache_clear()
+        get_report_path.cache_clear()
+        yield
+        get_git_root.cache_clear()
+        get_report_path.cache_clear()
+
     def test_get_git_root_success(self):
         """Test successful retrieval of git root directory."""
         # Setup - mock Path.exists to simulate .git directory
@@ -104,3 +114,18 @@ class TestGitUtils:
 
             # Verify - check that the result is the repo directory
             assert result == repo_dir
+
+    def test_get_git_root_is_cached(self):
+        """Test that the git root is only searched for once."""
+        first = get_git_root()
+
+        with patch("pathlib.Path.exists") as mock_exists:
+            assert get_git_root() is first
+            mock_exists.assert_not_called()
+
+    def test_get_report_path(self):
+        """Test that report paths are resolved under the git root once."""
+        path = get_report_path(ReportPaths.COVERAGE)
+
+        assert path == get_git_root() / "reports" / "coverage.json"
+        assert get_report_path(ReportPaths.COVERAGE) is path
@@ -0,0 +1,140 @@
+"""Tests for JSON utility functions."""
+
+import json
+import os
+import stat
+from unittest.mock import patch
+
+import ijson
+import pytest
+
+from mcp_suite.servers.qa.utils import json_utils
+from mcp_suite.servers.qa.utils.json_utils import (
+    consume_json_value,
+    load_json_file,
+    write_file_atomic,
+)
+
+
+class TestLoadJsonFile:
+    """Tests for the load_json_file function."""
+
+    def test_load_small_file(self, tmp_path):
+        """Test loading a file below the mmap threshold."""
+        path = tmp_path / "small.json"
+        path.write_text(json.dumps({"files": {"a.py": [1, 2]}}))
+
+        assert load_json_file(path) == {"files": {"a.py": [1, 2]}}
+
+    def test_load_large_file_uses_mmap(self, tmp_path, monkeypatch):
+        """Test loading a file at or above the mmap threshold."""
+        path = tmp_path / "large.json"
+        path.write_text(json.dumps({"tests": [{"nodeid": "t"}] * 100}))
+        monkeypatch.setattr(json_utils, "MMAP_THRESHOLD", 1)
+
+        assert load_json_file(str(path)) == {"tests": [{"nodeid": "t"}] * 100}
+
+    def test_invalid_json(self, tmp_path):
+        """Test that invalid JSON raises json.JSONDecodeError."""
+        path = tmp_path / "invalid.json"
+        path.write_text("invalid json")
+
+        with pytest.raises(json.JSONDecodeError):
+            load_json_file(path)
+
+    def test_file_not_found(self, tmp_path):
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            load_json_file(tmp_path / "missing.json")
+
+
+class TestWriteFileAtomic:
+    """Tests for the write_file_atomic function."""
+
+    def test_write_replaces_file(self, tmp_path):
+        """Test that the file is replaced and no temporary file is left."""
+        path = tmp_path / "report.json"
+        path.write_bytes(b"old")
+
+        write_file_atomic(path, b"new")
+
+        assert path.read_bytes() == b"new"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        """Test that a failed replace leaves the original file untouched."""
+        path = tmp_path / "report.json"
+        path.write_bytes(b"old")
+
+        with patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                write_file_atomic(path, b"new")
+
+        assert path.read_bytes() == b"old"
+        assert list(tmp_path.iterdir()) == [path]
+
+    def test_new_file_gets_umask_mode(self, tmp_path):
+        """Test that a new file gets the mode open() would give it."""
+        path = tmp_path / "report.json"
+        umask = os.umask(0)
+        os.umask(umask)
+
+        write_file_atomic(path, b"new")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o666 & ~umask
+
+    def test_replaced_file_keeps_mode(self, tmp_path):
+        """Test that a replaced file keeps its permissions."""
+        path = tmp_path / "report.json"
+        path.write_bytes(b"old")
+        path.chmod(0o640)
+
+        write_file_atomic(path, b"new")
+
+        assert stat.S_IMODE(path.stat().st_mode) == 0o640
+
+    def test_writers_use_distinct_temp_files(self, tmp_path):
+        """Test that each write goes through its own temporary file."""
+        path = tmp_path / "report.json"
+        real_replace = os.replace
+        sources = []
+
+        def record_replace(src, dst):
+            sources.append(src)
+            real_replace(src, dst)
+
+        with patch("os.replace", side_effect=record_replace):
+            write_file_atomic(path, b"first")
+            write_file_atomic(str(path), b"second")
+
+        assert path.read_bytes() == b"second"
+        assert len(set(sources)) == 2
+        assert all(os.path.dirname(src) == str(tmp_path) for src in sources)
+
+
+class TestConsumeJsonValue:
+    """Tests for the consume_json_value function."""
+
+    @pytest.mark.parametrize(
+        "value", [1, "text", None, {"a": [1, {"b": 2}]}, [[], {}, [3]]]
+    )
+    def test_builds_one_value(self, value):
+        """Test that exactly one value is consumed and built."""
+        events = ijson.parse(json.dumps([value, "next"]).encode())
+        next(events)  # start_array
+        builder = ijson.ObjectBuilder()
+
+        consume_json_value(events, builder)
+
+        assert builder.value == value
+        assert next(events)[2] == "next"
+
+    def test_skips_value_without_builder(self):
+        """Test that a value is skipped when no builder is given."""
+        events = ijson.parse(json.dumps({"skip": {"a": [1, 2]}, "keep": 3}).encode())
+        next(events)  # start_map
+        next(events)  # map_key "skip"
+
+        consume_json_value(events)
+
+        assert next(events)[1:] == ("map_key", "keep")
@@ -0,0 +1,42 @@
+"""Tests for the lint result cache."""
+
+import hashlib
+
+from mcp_suite.servers.qa.utils.lint_cache import file_digest, load_cache, save_cache
+
+META = {"flake8": "7.0.0", "max_line_length": 89, "ignore": "E203,W503"}
+
+
+class TestLintCache:
+    """Tests for the lint cache functions."""
+
+    def test_file_digest(self, tmp_path):
+        """Test that the digest is the SHA-256 of the file contents."""
+        path = tmp_path / "module.py"
+        path.write_bytes(b"import os\n")
+
+        assert file_digest(path) == hashlib.sha256(b"import os\n").hexdigest()
+
+    def test_round_trip(self, tmp_path):
+        """Test that saved entries are loaded back with the same meta."""
+        path = tmp_path / ".lint-cache.json"
+        entries = {"src/a.py": {"digest": "abc", "issues": [{"code": "F401"}]}}
+
+        save_cache(path, META, entries)
+
+        assert load_cache(path, META) == entries
+
+    def test_meta_mismatch(self, tmp_path):
+        """Test that entries built with other options are discarded."""
+        path = tmp_path / ".lint-cache.json"
+        save_cache(path, META, {"src/a.py": {"digest": "abc", "issues": []}})
+
+        assert load_cache(path, {**META, "max_line_length": 100}) == {}
+
+    def test_missing_or_invalid_cache(self, tmp_path):
+        """Test that a missing or corrupt cache file loads as empty."""
+        path = tmp_path / ".lint-cache.json"
+        assert load_cache(path, META) == {}
+
+        path.write_text("not json")
+        assert load_cache(path, META) == {}
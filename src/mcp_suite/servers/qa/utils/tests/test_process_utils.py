@@ -0,0 +1,32 @@
+"""Tests for subprocess utility functions."""
+
+import sys
+
+import pytest
+
+from mcp_suite.servers.qa.utils.process_utils import run_command
+
+
+class TestRunCommand:
+    """Tests for the run_command function."""
+
+    @pytest.mark.asyncio
+    async def test_captures_output(self, tmp_path):
+        """Test that stdout, stderr and the exit code are captured."""
+        script = (
+            "import os, sys; print(os.getcwd()); "
+            "print('warning', file=sys.stderr); sys.exit(3)"
+        )
+
+        result = await run_command([sys.executable, "-c", script], cwd=tmp_path)
+
+        assert result.returncode == 3
+        assert result.stdout.strip() == str(tmp_path)
+        assert result.stderr.strip() == "warning"
+        assert result.args == [sys.executable, "-c", script]
+
+    @pytest.mark.asyncio
+    async def test_missing_program(self, tmp_path):
+        """Test that a program that does not exist raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError):
+            await run_command(["saagalint-no-such-program"], cwd=tmp_path)